@@ -1,6 +1,8 @@
 from abc import ABC
 
+from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from crud.base_crud import CRUDBase
 
@@ -13,6 +15,10 @@ class BaseAdminManager(ABC):
     которые будут использоваться для взаимодействия с CRUD-операциями
     и клавиатурами администратора.
 
+    Менеджеры создаются один раз на модуль и общие для всех
+    администраторов, поэтому выбранный объект хранится не в атрибутах
+    менеджера, а в данных FSM конкретного пользователя.
+
     Attributes:
         model_crud (CRUDBase): Объект для выполнения операций CRUD с моделью.
         back_option (str): Данные для возврата в меню.
@@ -25,3 +31,14 @@ class BaseAdminManager(ABC):
         self.model_crud = model_crud
         self.back_option = back_option
         self.states_group = states_group
+
+    async def set_selected_obj(self, state: FSMContext, obj_id: int) -> None:
+        """Запомнить id выбранного объекта в данных FSM."""
+        await state.update_data(obj_id=obj_id)
+
+    async def get_selected_obj(
+        self, state: FSMContext, session: AsyncSession
+    ):
+        """Получить из БД объект, выбранный пользователем."""
+        data = await state.get_data()
+        return await self.model_crud.get(data.get("obj_id"), session)
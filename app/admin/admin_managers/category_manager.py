@@ -4,10 +4,9 @@ from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin.keyboards.keyboards import (
-    get_inline_confirmation,
     get_inline_keyboard,
+    get_object_callbacks,
 )
-from admin.admin_settings import ADMIN_UPDATE_BUTTONS
 from crud.base_crud import CRUDBase
 from crud.category_product import category_product_crud
 from .create_manager import CreateManager
@@ -85,32 +84,16 @@ class UpdateCategoryManager(UpdateManager):
         obj_list = await self.model_crud.get_category_by_product_id(
             product_id, session
         )
-        obj_names = [obj.name for obj in obj_list]
-        obj_ids = [obj.id for obj in obj_list]
         await callback.message.edit_text(
             "Какой объект отредактировать?",
             reply_markup=await get_inline_keyboard(
-                options=obj_names,
-                callback=obj_ids,
+                options=[obj.name for obj in obj_list],
+                callback=get_object_callbacks(obj_list),
                 previous_menu=self.back_option,
             ),
         )
         await state.set_state(self.states_group.select)
 
-    async def select_data_to_update(
-        self,
-        callback: CallbackQuery,
-        session: AsyncSession,
-    ):
-        """Выбрать поле редактирования для модели в БД."""
-        self.obj_to_update = await self.model_crud.get(callback.data, session)
-        await callback.message.edit_text(
-            "Выбирите данные для обновления:",
-            reply_markup=await get_inline_keyboard(
-                ADMIN_UPDATE_BUTTONS, previous_menu=self.back_option
-            ),
-        )
-
 
 class DeleteCategoryManager(DeleteManager):
     def __init__(
@@ -131,30 +114,12 @@ class DeleteCategoryManager(DeleteManager):
         obj_list = await self.model_crud.get_category_by_product_id(
             product_id, session
         )
-        obj_names = [obj.name for obj in obj_list]
-        obj_ids = [obj.id for obj in obj_list]
         await callback.message.edit_text(
             "Какие данные удалить?",
             reply_markup=await get_inline_keyboard(
-                options=obj_names,
-                callback=obj_ids,
+                options=[obj.name for obj in obj_list],
+                callback=get_object_callbacks(obj_list),
                 previous_menu=self.back_option,
             ),
         )
         await state.set_state(self.states_group.select)
-
-    async def confirm_delete(
-        self,
-        callback: CallbackQuery,
-        state: FSMContext,
-        session: AsyncSession,
-    ) -> None:
-        """Подтвердить выбор объекта для удаления."""
-        self.obj_to_delete = await self.model_crud.get(callback.data, session)
-        await callback.message.edit_text(
-            f"Вы уверены, что хотите удалить эти данные?\n\n {self.obj_to_delete.name}",
-            reply_markup=await get_inline_confirmation(
-                cancel_option=self.back_option
-            ),
-        ),
-        await state.set_state(self.states_group.confirm)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
@@ -11,6 +13,8 @@ from admin.admin_settings import ADMIN_CONTENT_BUTTONS
 from .base_manager import (
     BaseAdminManager,
 )
+from bot.catalog_cache import catalog_cache
+from core.db import run_after_commit
 from crud.base_crud import CRUDBase
 
 
@@ -248,11 +252,16 @@ class CreateManager(BaseAdminManager):
 
             data = await state.get_data()
             await self.model_crud.create(data, session)
+            await run_after_commit(session, catalog_cache.invalidate)
 
-            await message.answer(
-                "Данные добавлены!",
-                reply_markup=await get_inline_keyboard(
-                    previous_menu=self.back_option
+            await run_after_commit(
+                session,
+                partial(
+                    message.answer,
+                    "Данные добавлены!",
+                    reply_markup=await get_inline_keyboard(
+                        previous_menu=self.back_option
+                    ),
                 ),
             )
         except Exception as e:
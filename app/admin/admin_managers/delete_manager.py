@@ -1,12 +1,18 @@
+from functools import partial
+
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.catalog_cache import catalog_cache
+from core.db import run_after_commit
 from crud.base_crud import CRUDBase
 
 from .base_manager import BaseAdminManager
 from admin.keyboards.keyboards import (
+    AdminObjectCallback,
+    get_object_callbacks,
     get_inline_confirmation,
     get_inline_keyboard,
 )
@@ -35,13 +41,10 @@ class DeleteManager(BaseAdminManager):
 
 
     Methods:
-        get_all_model_names(session: AsyncSession) -> list[str]:
-            Получает список названий объектов из таблицы БД.
-
         select_obj_to_delete(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
             Запрашивает у пользователя, какой объект он хочет удалить, и отображает список объектов.
 
-        confirm_delete(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
+        confirm_delete(callback: CallbackQuery, callback_data: AdminObjectCallback, state: FSMContext, session: AsyncSession) -> None:
             Подтверждает выбор объекта для удаления и запрашивает подтверждение от пользователя.
 
         delete_obj(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
@@ -56,11 +59,6 @@ class DeleteManager(BaseAdminManager):
     ) -> None:
         super().__init__(model_crud, back_option, states_group)
 
-    async def get_all_model_names(self, session: AsyncSession) -> list[str]:
-        """Получить список названий объектов из таблицы БД."""
-        models = await self.model_crud.get_multi(session)
-        return [model.name for model in models]
-
     async def select_obj_to_delete(
         self,
         callback: CallbackQuery,
@@ -68,11 +66,13 @@ class DeleteManager(BaseAdminManager):
         session: AsyncSession,
     ) -> None:
         """Выбрать объкт для удаления."""
-        obj_list_by_name = await self.get_all_model_names(session)
+        obj_list = await self.model_crud.get_multi(session)
         await callback.message.edit_text(
             "Какие данные удалить?",
             reply_markup=await get_inline_keyboard(
-                obj_list_by_name, previous_menu=self.back_option
+                options=[obj.name for obj in obj_list],
+                callback=get_object_callbacks(obj_list),
+                previous_menu=self.back_option,
             ),
         )
         await state.set_state(self.states_group.select)
@@ -80,15 +80,17 @@ class DeleteManager(BaseAdminManager):
     async def confirm_delete(
         self,
         callback: CallbackQuery,
+        callback_data: AdminObjectCallback,
         state: FSMContext,
         session: AsyncSession,
     ) -> None:
         """Подтвердить выбор объекта для удаления."""
-        self.obj_to_delete = await self.model_crud.get_by_string(
-            callback.data, session
+        obj_to_delete = await self.model_crud.get(
+            callback_data.obj_id, session
         )
+        await self.set_selected_obj(state, obj_to_delete.id)
         await callback.message.edit_text(
-            f"Вы уверены, что хотите удалить эти данные?\n\n {self.obj_to_delete.name}",
+            f"Вы уверены, что хотите удалить эти данные?\n\n {obj_to_delete.name}",
             reply_markup=await get_inline_confirmation(
                 cancel_option=self.back_option
             ),
@@ -103,11 +105,17 @@ class DeleteManager(BaseAdminManager):
     ) -> None:
         """Удалить объект из БД."""
         try:
-            await self.model_crud.remove(self.obj_to_delete, session)
-            await callback.message.edit_text(
-                "Данные удалены!",
-                reply_markup=await get_inline_keyboard(
-                    previous_menu=self.back_option
+            obj_to_delete = await self.get_selected_obj(state, session)
+            await self.model_crud.remove(obj_to_delete, session)
+            await run_after_commit(session, catalog_cache.invalidate)
+            await run_after_commit(
+                session,
+                partial(
+                    callback.message.edit_text,
+                    "Данные удалены!",
+                    reply_markup=await get_inline_keyboard(
+                        previous_menu=self.back_option
+                    ),
                 ),
             )
         except Exception as e:
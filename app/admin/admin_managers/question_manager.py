@@ -1,15 +1,21 @@
 from abc import ABC
+from functools import partial
+
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin.keyboards.keyboards import (
+    AdminObjectCallback,
     get_inline_confirmation,
     get_inline_keyboard,
+    get_object_callbacks,
 )
 from admin.admin_settings import ADMIN_QUESTION_BUTTONS, SUPPORT_OPTIONS
 from admin.handlers.validators import validate_button_name_len
+from bot.catalog_cache import catalog_cache
+from core.db import run_after_commit
 from crud.info_crud import info_crud
 
 
@@ -33,13 +39,29 @@ class QuestionBaseManager(ABC):
     """
     Базовый класс для управления вопросами.
     Определяет основные методы для работы с вопросами и их типами.
+
+    Раздел вопросов и выбранный вопрос хранятся в данных FSM
+    пользователя: менеджеры общие для всех администраторов.
     """
 
-    async def set_question_type(self, state: FSMContext):
-        state = await state.get_state()
-        self.question_type = state.split(":")[-1]
-        self.back_option = SUPPORT_OPTIONS.get(self.question_type)
-        return self.back_option
+    async def set_question_type(self, state: FSMContext) -> str:
+        """Запомнить раздел вопросов по текущему машинному состоянию."""
+        current_state = await state.get_state()
+        back_option = SUPPORT_OPTIONS.get(current_state.split(":")[-1])
+        await state.update_data(back_option=back_option)
+        return back_option
+
+    async def get_back_option(self, state: FSMContext) -> str:
+        """Получить раздел вопросов для кнопки возврата."""
+        data = await state.get_data()
+        return data.get("back_option")
+
+    async def get_selected_question(
+        self, state: FSMContext, session: AsyncSession
+    ):
+        """Получить из БД вопрос, выбранный пользователем."""
+        data = await state.get_data()
+        return await info_crud.get(data.get("question_id"), session)
 
 
 class QuestionUpdateDeleteBase(QuestionBaseManager, ABC):
@@ -47,13 +69,12 @@ class QuestionUpdateDeleteBase(QuestionBaseManager, ABC):
     Базовый класс для управления обновлением и удалением вопросов.
     """
 
-    async def get_question_list(self, session: AsyncSession):
-        return [
-            question.question
-            for question in await info_crud.get_all_questions_by_type(
-                self.question_type, session
-            )
-        ]
+    async def get_question_list(
+        self, question_type: str, session: AsyncSession
+    ):
+        return await info_crud.get_all_questions_by_type(
+            question_type, session
+        )
 
     async def select_question(
         self,
@@ -62,12 +83,14 @@ class QuestionUpdateDeleteBase(QuestionBaseManager, ABC):
         next_state: State,
         session: AsyncSession,
     ):
-        self.question_type = await self.set_question_type(state)
-        questions = await self.get_question_list(session)
+        back_option = await self.set_question_type(state)
+        questions = await self.get_question_list(back_option, session)
         await callback.message.edit_text(
             "Выберте категорию вопросов:",
             reply_markup=await get_inline_keyboard(
-                questions, previous_menu=self.back_option
+                options=[question.question for question in questions],
+                callback=get_object_callbacks(questions),
+                previous_menu=back_option,
             ),
         )
         await state.set_state(next_state)
@@ -86,13 +109,12 @@ class QuestionCreateManager(QuestionBaseManager):
         следующее машинное состояние.
         """
         await callback.message.delete()
-        await state.update_data(
-            question_type=await self.set_question_type(state)
-        )
+        back_option = await self.set_question_type(state)
+        await state.update_data(question_type=back_option)
         await callback.message.answer(
             "Введите название для категории вопров:",
             reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+                previous_menu=back_option
             ),
         )
         await state.set_state(CreateQuestionStates.question)
@@ -102,6 +124,7 @@ class QuestionCreateManager(QuestionBaseManager):
         Добавить ответ и перейти в
         следующее машинное состояние.
         """
+        back_option = await self.get_back_option(state)
         if not validate_button_name_len(message.text):
             await message.answer(
                 (
@@ -110,7 +133,7 @@ class QuestionCreateManager(QuestionBaseManager):
                     "Попробуйте ввести название покороче."
                 ),
                 reply_markup=await get_inline_keyboard(
-                    previous_menu=self.back_option
+                    previous_menu=back_option
                 ),
             )
             return
@@ -118,7 +141,7 @@ class QuestionCreateManager(QuestionBaseManager):
         await message.answer(
             "Введите вопросы и ответы для данной категории:",
             reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+                previous_menu=back_option
             ),
         )
         await state.set_state(CreateQuestionStates.answer)
@@ -134,10 +157,15 @@ class QuestionCreateManager(QuestionBaseManager):
             await state.update_data(answer=message.text)
             data = await state.get_data()
             await info_crud.create(data, session=session)
-            await message.answer(
-                "Вопрос добавлен!",
-                reply_markup=await get_inline_keyboard(
-                    previous_menu=self.back_option
+            await run_after_commit(session, catalog_cache.invalidate)
+            await run_after_commit(
+                session,
+                partial(
+                    message.answer,
+                    "Вопрос добавлен!",
+                    reply_markup=await get_inline_keyboard(
+                        previous_menu=data.get("back_option")
+                    ),
                 ),
             )
             await state.clear()
@@ -151,32 +179,46 @@ class QuestionUpdateManager(QuestionUpdateDeleteBase):
     """
 
     async def update_data_type(
-        self, callback: CallbackQuery, session: AsyncSession
+        self,
+        callback: CallbackQuery,
+        callback_data: AdminObjectCallback,
+        state: FSMContext,
     ):
-        self.question = await info_crud.get_by_string(callback.data, session)
+        await state.update_data(question_id=callback_data.obj_id)
         await callback.message.edit_text(
             "Что отредактировать?",
             reply_markup=await get_inline_keyboard(
-                ADMIN_QUESTION_BUTTONS, previous_menu=self.back_option
+                ADMIN_QUESTION_BUTTONS,
+                previous_menu=await self.get_back_option(state),
             ),
         )
 
     async def update_question(
-        self, callback: CallbackQuery, state: FSMContext
+        self,
+        callback: CallbackQuery,
+        state: FSMContext,
+        session: AsyncSession,
     ):
+        question = await self.get_selected_question(state, session)
         await callback.message.edit_text(
-            f"Текущий текст вопроса: \n\n {self.question.question}\n\n Введите новый текст:",
+            f"Текущий текст вопроса: \n\n {question.question}\n\n Введите новый текст:",
             reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+                previous_menu=await self.get_back_option(state)
             ),
         )
         await state.set_state(UpdateQuestionStates.question)
 
-    async def update_answer(self, callback: CallbackQuery, state: FSMContext):
+    async def update_answer(
+        self,
+        callback: CallbackQuery,
+        state: FSMContext,
+        session: AsyncSession,
+    ):
+        question = await self.get_selected_question(state, session)
         await callback.message.edit_text(
-            f"Текущий текст ответа: {self.question.answer}\n\n Введите новый текст:",
+            f"Текущий текст ответа: {question.answer}\n\n Введите новый текст:",
             reply_markup=await get_inline_keyboard(
-                previous_menu=self.question_type
+                previous_menu=await self.get_back_option(state)
             ),
         )
         await state.set_state(UpdateQuestionStates.answer)
@@ -190,11 +232,17 @@ class QuestionUpdateManager(QuestionUpdateDeleteBase):
         elif current_state == UpdateQuestionStates.answer.state:
             await state.update_data(answer=message.text)
         data = await state.get_data()
-        await info_crud.update(self.question, data, session)
-        await message.answer(
-            "Данные обновлены!",
-            reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+        question = await self.get_selected_question(state, session)
+        await info_crud.update(question, data, session)
+        await run_after_commit(session, catalog_cache.invalidate)
+        await run_after_commit(
+            session,
+            partial(
+                message.answer,
+                "Данные обновлены!",
+                reply_markup=await get_inline_keyboard(
+                    previous_menu=data.get("back_option")
+                ),
             ),
         )
         await state.clear()
@@ -208,14 +256,16 @@ class QuestionDeleteManager(QuestionUpdateDeleteBase):
     async def confirm_delete(
         self,
         callback: CallbackQuery,
+        callback_data: AdminObjectCallback,
         state: FSMContext,
         session: AsyncSession,
     ) -> None:
-        self.question = await info_crud.get_by_string(callback.data, session)
+        question = await info_crud.get(callback_data.obj_id, session)
+        await state.update_data(question_id=question.id)
         await callback.message.edit_text(
-            f"Вы уверены, что хотите удалить этот вопрос'?\n\n {self.question.question}",
+            f"Вы уверены, что хотите удалить этот вопрос'?\n\n {question.question}",
             reply_markup=await get_inline_confirmation(
-                cancel_option=self.back_option
+                cancel_option=await self.get_back_option(state)
             ),
         ),
         await state.set_state(DeleteQuestionStates.confirm)
@@ -228,11 +278,17 @@ class QuestionDeleteManager(QuestionUpdateDeleteBase):
     ) -> None:
         """Удалить вопрос из БД."""
         try:
-            await info_crud.remove(self.question, session)
-            await callback.message.edit_text(
-                "Вопрос удален!",
-                reply_markup=await get_inline_keyboard(
-                    previous_menu=self.back_option
+            question = await self.get_selected_question(state, session)
+            await info_crud.remove(question, session)
+            await run_after_commit(session, catalog_cache.invalidate)
+            await run_after_commit(
+                session,
+                partial(
+                    callback.message.edit_text,
+                    "Вопрос удален!",
+                    reply_markup=await get_inline_keyboard(
+                        previous_menu=await self.get_back_option(state)
+                    ),
                 ),
             )
             await state.clear()
@@ -1,3 +1,5 @@
+from functools import partial
+
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.state import State, StatesGroup
@@ -8,9 +10,13 @@ from .base_manager import (
     BaseAdminManager,
 )
 from admin.keyboards.keyboards import (
+    AdminObjectCallback,
+    get_object_callbacks,
     get_inline_keyboard,
 )
 from admin.admin_settings import ADMIN_UPDATE_BUTTONS
+from bot.catalog_cache import catalog_cache
+from core.db import run_after_commit
 from crud.base_crud import CRUDBase
 from crud.portfolio_projects_crud import portfolio_crud
 
@@ -42,19 +48,16 @@ class UpdateManager(BaseAdminManager):
         staes_group (StaesGroup): Набор машинных состояний
 
     Methods:
-        get_all_model_names(session: AsyncSession) -> list[str]:
-            Получает список названий объектов из таблицы БД.
-
         select_obj_to_update(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
             Запрашивает у пользователя, какой объект он хочет отредактировать, и отображает список объектов.
 
-        select_data_to_update(callback: CallbackQuery, session: AsyncSession) -> None:
-            Позволяет выбрать поле для редактирования объекта в БД.
+        select_data_to_update(callback: CallbackQuery, callback_data: AdminObjectCallback, state: FSMContext) -> None:
+            Запоминает выбранный объект и позволяет выбрать поле для редактирования.
 
-        change_obj_name(callback: CallbackQuery, state: FSMContext) -> None:
+        change_obj_name(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
             Запрашивает новое название для объекта и обновляет состояние.
 
-        change_obj_content(callback: CallbackQuery, state: FSMContext) -> None:
+        change_obj_content(callback: CallbackQuery, state: FSMContext, session: AsyncSession) -> None:
             Позволяет пользователю изменить содержание объекта, включая текст, URL и медиафайлы.
 
         update_obj_in_db(message: Message, state: FSMContext, session: AsyncSession) -> None:
@@ -69,22 +72,19 @@ class UpdateManager(BaseAdminManager):
     ) -> None:
         super().__init__(model_crud, back_option, states_group)
 
-    async def get_all_model_names(self, session: AsyncSession) -> list[str]:
-        """Получить список названий объектов из таблицы БД."""
-        models = await self.model_crud.get_multi(session)
-        return [model.name for model in models]
-
     async def select_obj_to_update(
         self,
         callback: CallbackQuery,
         state: FSMContext,
         session: AsyncSession,
     ) -> None:
-        obj_list_by_name = await self.get_all_model_names(session)
+        obj_list = await self.model_crud.get_multi(session)
         await callback.message.edit_text(
             "Какой объект отредактировать?",
             reply_markup=await get_inline_keyboard(
-                obj_list_by_name, previous_menu=self.back_option
+                options=[obj.name for obj in obj_list],
+                callback=get_object_callbacks(obj_list),
+                previous_menu=self.back_option,
             ),
         )
         await state.set_state(self.states_group.select)
@@ -92,12 +92,11 @@ class UpdateManager(BaseAdminManager):
     async def select_data_to_update(
         self,
         callback: CallbackQuery,
-        session: AsyncSession,
+        callback_data: AdminObjectCallback,
+        state: FSMContext,
     ):
         """Выбрать поле редактирования для модели в БД."""
-        self.obj_to_update = await self.model_crud.get_by_string(
-            callback.data, session
-        )
+        await self.set_selected_obj(state, callback_data.obj_id)
         await callback.message.edit_text(
             "Выбирите данные для обновления:",
             reply_markup=await get_inline_keyboard(
@@ -106,11 +105,15 @@ class UpdateManager(BaseAdminManager):
         )
 
     async def change_obj_name(
-        self, callback: CallbackQuery, state: FSMContext
+        self,
+        callback: CallbackQuery,
+        state: FSMContext,
+        session: AsyncSession,
     ):
         """Внести изменение в название объекта."""
+        obj_to_update = await self.get_selected_obj(state, session)
         message_text = (
-            f"Текущее название: \n\n {self.obj_to_update.name} \n\n"
+            f"Текущее название: \n\n {obj_to_update.name} \n\n"
             "Введите новое:"
         )
         await callback.message.edit_text(
@@ -122,22 +125,26 @@ class UpdateManager(BaseAdminManager):
         await state.set_state(self.states_group.name)
 
     async def change_obj_content(
-        self, callback: CallbackQuery, state: FSMContext
+        self,
+        callback: CallbackQuery,
+        state: FSMContext,
+        session: AsyncSession,
     ):
         """Внести изменение в содержание объекта."""
-        obj_fields = self.obj_to_update.__dict__.keys()
-        if "media" not in obj_fields or not self.obj_to_update.media:
-            if "url" in obj_fields and self.obj_to_update.url:
+        obj_to_update = await self.get_selected_obj(state, session)
+        obj_fields = obj_to_update.__dict__.keys()
+        if "media" not in obj_fields or not obj_to_update.media:
+            if "url" in obj_fields and obj_to_update.url:
                 message_text = (
-                    f"Текущий адрес ссылки: \n\n {self.obj_to_update.url} \n\n"
+                    f"Текущий адрес ссылки: \n\n {obj_to_update.url} \n\n"
                     "Введите новый:"
                 )
                 await state.set_state(self.states_group.url)
             elif (
-                "description" in obj_fields and self.obj_to_update.description
+                "description" in obj_fields and obj_to_update.description
             ):
                 message_text = (
-                    f"Текущее описание: \n\n {self.obj_to_update.description} \n\n"
+                    f"Текущее описание: \n\n {obj_to_update.description} \n\n"
                     "Введите новое:"
                 )
                 await state.set_state(self.states_group.description)
@@ -150,8 +157,8 @@ class UpdateManager(BaseAdminManager):
         else:
             await callback.message.answer("Текущая картинка:")
             await callback.message.answer_photo(
-                photo=self.obj_to_update.media,
-                caption=self.obj_to_update.description,
+                photo=obj_to_update.media,
+                caption=obj_to_update.description,
             )
             await callback.message.answer(
                 (
@@ -203,12 +210,18 @@ class UpdateManager(BaseAdminManager):
             )
 
         data = await state.get_data()
-        await self.model_crud.update(self.obj_to_update, data, session)
-
-        await message.answer(
-            "Данные обновлены!",
-            reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+        obj_to_update = await self.get_selected_obj(state, session)
+        await self.model_crud.update(obj_to_update, data, session)
+        await run_after_commit(session, catalog_cache.invalidate)
+
+        await run_after_commit(
+            session,
+            partial(
+                message.answer,
+                "Данные обновлены!",
+                reply_markup=await get_inline_keyboard(
+                    previous_menu=self.back_option
+                ),
             ),
         )
 
@@ -238,12 +251,15 @@ class UpdatePortfolio:
         self.states_group = states_group
 
     async def update_main_portfolio_url(
-        self, callback: CallbackQuery, state: FSMContext, session: AsyncSession
+        self,
+        callback: CallbackQuery,
+        state: FSMContext,
+        session: AsyncSession,
     ):
         """Изменить URL основного портфолио."""
-        self.obj_to_update = await portfolio_crud.get_portfolio(session)
+        portfolio = await portfolio_crud.get_portfolio(session)
         message_text = (
-            f"Текущий адрес ссылки: \n\n {self.obj_to_update.url} \n\n"
+            f"Текущий адрес ссылки: \n\n {portfolio.url} \n\n"
             "Введите новый:"
         )
         await state.set_state(self.states_group.portfolio)
@@ -261,11 +277,17 @@ class UpdatePortfolio:
 
         await state.update_data(url=message.text)
         data = await state.get_data()
-        await portfolio_crud.update(self.obj_to_update, data, session)
-
-        await message.answer(
-            "Данные обновлены!",
-            reply_markup=await get_inline_keyboard(
-                previous_menu=self.back_option
+        portfolio = await portfolio_crud.get_portfolio(session)
+        await portfolio_crud.update(portfolio, data, session)
+        await run_after_commit(session, catalog_cache.invalidate)
+
+        await run_after_commit(
+            session,
+            partial(
+                message.answer,
+                "Данные обновлены!",
+                reply_markup=await get_inline_keyboard(
+                    previous_menu=self.back_option
+                ),
             ),
         )
@@ -62,9 +62,11 @@ SUPERUSER_SPECIAL_OPTIONS = {
     "support_request": "Запросы на техподдержку",
     "feedbacks": "Отзывы",
     "promotion": "Управление персоналом",
-    "set_timer": "Изменить таймер активности"
+    "set_timer": "Изменить таймер активности",
+    "broadcast": "Рассылка пользователям",
 }
 SUPERUSER_SPECIAL_BUTTONS = get_buttons(SUPERUSER_SPECIAL_OPTIONS)
+BROADCAST_CONFIRM = "confirm_broadcast"
 SUPERUSER_PROMOTION_OPTIONS = {
     "manager_list": "Список админов и менеджеров",
     "promote_to_admin": "Добавить администратора",
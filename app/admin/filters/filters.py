@@ -21,7 +21,7 @@ class IsManagerOrAdmin(Filter):
     async def __call__(
         self, message: types.Message, bot: Bot, session: AsyncSession
     ) -> bool:
-        user_role = await user_crud.get_role_by_tg_id(
+        user_role = await user_crud.get_cached_role_by_tg_id(
             message.from_user.id, session
         )
         return user_role in {RoleEnum.ADMIN, RoleEnum.MANAGER}
@@ -34,7 +34,7 @@ class IsAdminOnly(Filter):
     async def __call__(
         self, message: types.Message, bot: Bot, session: AsyncSession
     ) -> bool:
-        user_role = await user_crud.get_role_by_tg_id(
+        user_role = await user_crud.get_cached_role_by_tg_id(
             message.from_user.id, session
         )
         return user_role == RoleEnum.ADMIN
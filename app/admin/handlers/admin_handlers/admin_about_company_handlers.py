@@ -1,7 +1,7 @@
 import logging
 
 from aiogram import F, Router
-from aiogram.filters import and_f, or_f
+from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +11,7 @@ from .admin import SectionState
 from bot.exceptions import message_exception_handler
 from crud import company_info_crud
 from admin.filters.filters import ChatTypeFilter, IsManagerOrAdmin
+from admin.keyboards.keyboards import AdminObjectCallback
 from admin.admin_managers import (
     DeleteManager,
     DeleteState,
@@ -98,12 +99,19 @@ async def about_info_to_delete(
 @message_exception_handler(
     log_error_text="Ошибка при подтверждении удаления информации"
 )
-@about_router.callback_query(DeleteState.select, F.data != PREVIOUS_MENU)
+@about_router.callback_query(
+    DeleteState.select, AdminObjectCallback.filter()
+)
 async def confirm_delete_info(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+    session: AsyncSession,
 ):
     """Подтвердить удаление выбранного объекта."""
-    await about_delete_manager.confirm_delete(callback, state, session)
+    await about_delete_manager.confirm_delete(
+        callback, callback_data, state, session
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} подтвердил удаление информации."
     )
@@ -143,16 +151,17 @@ async def about_info_to_update(
     log_error_text="Ошибка при обработке выбора данных для обновления"
 )
 @about_router.callback_query(
-    UpdateState.select,
-    and_f(
-        F.data != ADMIN_UPDATE_OPTIONS.get("name"),
-        F.data != ADMIN_UPDATE_OPTIONS.get("content"),
-        F.data != PREVIOUS_MENU,
-    ),
-)
-async def update_info_choice(callback: CallbackQuery, session: AsyncSession):
+    UpdateState.select, AdminObjectCallback.filter()
+)
+async def update_info_choice(
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+):
     """Обработать выбор данных для обновления."""
-    await about_update_manager.select_data_to_update(callback, session)
+    await about_update_manager.select_data_to_update(
+        callback, callback_data, state
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} выбрал данные для обновления."
     )
@@ -164,9 +173,13 @@ async def update_info_choice(callback: CallbackQuery, session: AsyncSession):
 @about_router.callback_query(
     UpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("name")
 )
-async def about_name_update(callback: CallbackQuery, state: FSMContext):
+async def about_name_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Обновить имя объекта."""
-    await about_update_manager.change_obj_name(callback, state)
+    await about_update_manager.change_obj_name(callback, state, session)
     logger.info(f"Пользователь {callback.from_user.id} обновил имя объекта.")
 
 
@@ -176,9 +189,13 @@ async def about_name_update(callback: CallbackQuery, state: FSMContext):
 @about_router.callback_query(
     UpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("content")
 )
-async def about_url_update(callback: CallbackQuery, state: FSMContext):
+async def about_url_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Обновить содержимое объекта."""
-    await about_update_manager.change_obj_content(callback, state)
+    await about_update_manager.change_obj_content(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} обновил содержимое объекта."
     )
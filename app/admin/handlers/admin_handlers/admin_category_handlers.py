@@ -1,7 +1,7 @@
 import logging
 
 from aiogram import F, Router
-from aiogram.filters import or_f, and_f
+from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State
 from aiogram.types import CallbackQuery, Message
@@ -26,7 +26,11 @@ from admin.admin_settings import (
     ADMIN_UPDATE_OPTIONS,
     MAIN_MENU_OPTIONS,
 )
-from admin.keyboards.keyboards import get_inline_keyboard
+from admin.keyboards.keyboards import (
+    AdminObjectCallback,
+    get_inline_keyboard,
+    get_object_callbacks,
+)
 from bot.exceptions import message_exception_handler
 from crud import category_product_crud, products_crud
 
@@ -78,6 +82,7 @@ async def get_back_to_category_menu(
         f"{product.description}",
         reply_markup=await get_inline_keyboard(
             categories_by_name,
+            callback=get_object_callbacks(categories),
             urls=urls,
             previous_menu=MAIN_MENU_OPTIONS.get("products"),
             admin_update_menu=callback.data,
@@ -209,12 +214,19 @@ async def product_to_delete(
 @message_exception_handler(
     log_error_text="Ошибка при подтверждении удаления категории"
 )
-@category_router.callback_query(CategoryDeleteState.select, F.data)
+@category_router.callback_query(
+    CategoryDeleteState.select, AdminObjectCallback.filter()
+)
 async def confirm_delete(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+    session: AsyncSession,
 ):
     """Подтверждение удаления категории."""
-    await category_delete_manager.confirm_delete(callback, state, session)
+    await category_delete_manager.confirm_delete(
+        callback, callback_data, state, session
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} подтвердил удаление категории."
     )
@@ -259,17 +271,17 @@ async def category_to_update(
     log_error_text="Ошибка при выборе данных для обновления категории"
 )
 @category_router.callback_query(
-    CategoryUpdateState.select,
-    and_f(
-        F.data != ADMIN_UPDATE_OPTIONS.get("name"),
-        F.data != ADMIN_UPDATE_OPTIONS.get("content"),
-    ),
+    CategoryUpdateState.select, AdminObjectCallback.filter()
 )
 async def select_category_data_to_update(
-    callback: CallbackQuery, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
 ):
     """Выбор поля для редактирования категории."""
-    await category_update_manager.select_data_to_update(callback, session)
+    await category_update_manager.select_data_to_update(
+        callback, callback_data, state
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} выбрал данные для обновления категории."
     )
@@ -281,9 +293,13 @@ async def select_category_data_to_update(
 @category_router.callback_query(
     CategoryUpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("name")
 )
-async def category_name_update(callback: CallbackQuery, state: FSMContext):
+async def category_name_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Ввести новое название категории."""
-    await category_update_manager.change_obj_name(callback, state)
+    await category_update_manager.change_obj_name(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} обновил название категории."
     )
@@ -295,9 +311,13 @@ async def category_name_update(callback: CallbackQuery, state: FSMContext):
 @category_router.callback_query(
     CategoryUpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("content")
 )
-async def about_url_update(callback: CallbackQuery, state: FSMContext):
+async def about_url_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Изменить содержание категории."""
-    await category_update_manager.change_obj_content(callback, state)
+    await category_update_manager.change_obj_content(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} обновил содержание категории."
     )
@@ -15,6 +15,7 @@ from admin.admin_managers import (
     DeleteQuestionStates,
 )
 from admin.filters.filters import ChatTypeFilter, IsManagerOrAdmin
+from admin.keyboards.keyboards import AdminObjectCallback
 from admin.handlers.admin_handlers.admin import SectionState
 from admin.admin_settings import (
     ADMIN_BASE_OPTIONS,
@@ -101,14 +102,18 @@ async def question_to_delete(
     log_error_text='Ошибка при подтверждении удаления вопроса'
 )
 @info_router.callback_query(
-    DeleteQuestionStates.select,
-    and_f(F.data != PROBLEMS_MENU, F.data != GENERAL_QEUSTIONS_MENU),
+    DeleteQuestionStates.select, AdminObjectCallback.filter()
 )
 async def confirm_delete_question(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+    session: AsyncSession,
 ):
     """Подтвердить удаление вопроса."""
-    await question_delete_manager.confirm_delete(callback, state, session)
+    await question_delete_manager.confirm_delete(
+        callback, callback_data, state, session
+    )
     logger.info(
         f'Пользователь {callback.from_user.id} подтвердил удаление вопроса.'
     )
@@ -153,19 +158,17 @@ async def update_question(
     log_error_text='Ошибка при выборе данных для обновления вопроса'
 )
 @info_router.callback_query(
-    UpdateQuestionStates.select,
-    and_f(
-        F.data != ADMIN_QUESTION_OPTIONS.get("question"),
-        F.data != ADMIN_QUESTION_OPTIONS.get("answer"),
-        F.data != PROBLEMS_MENU,
-        F.data != GENERAL_QEUSTIONS_MENU,
-    ),
+    UpdateQuestionStates.select, AdminObjectCallback.filter()
 )
 async def update_question_choice(
-    callback: CallbackQuery, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
 ):
     """Обработать выбор данных для обновления вопроса."""
-    await question_update_manager.update_data_type(callback, session)
+    await question_update_manager.update_data_type(
+        callback, callback_data, state
+    )
     logger.info(
         f'Пользователь {callback.from_user.id} выбрал данные для обновления вопроса.'
     )
@@ -178,9 +181,13 @@ async def update_question_choice(
     UpdateQuestionStates.select,
     F.data == ADMIN_QUESTION_OPTIONS.get("question"),
 )
-async def update_question_text(callback: CallbackQuery, state: FSMContext):
+async def update_question_text(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Обновить текст вопроса."""
-    await question_update_manager.update_question(callback, state)
+    await question_update_manager.update_question(callback, state, session)
     logger.info(f'Пользователь {callback.from_user.id} обновил текст вопроса.')
 
 
@@ -190,9 +197,13 @@ async def update_question_text(callback: CallbackQuery, state: FSMContext):
 @info_router.callback_query(
     UpdateQuestionStates.select, F.data == ADMIN_QUESTION_OPTIONS.get("answer")
 )
-async def update_question_answer(callback: CallbackQuery, state: FSMContext):
+async def update_question_answer(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Обновить ответ на вопрос."""
-    await question_update_manager.update_answer(callback, state)
+    await question_update_manager.update_answer(callback, state, session)
     logger.info(
         f'Пользователь {callback.from_user.id} обновил ответ на вопрос.'
     )
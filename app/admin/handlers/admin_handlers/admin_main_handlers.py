@@ -23,8 +23,10 @@ from admin.admin_settings import (
 )
 from admin.filters.filters import ChatTypeFilter
 from admin.keyboards.keyboards import (
+    AdminObjectCallback,
     get_inline_keyboard,
     get_delete_message_keyboard,
+    get_object_callbacks,
 )
 from bot.exceptions import message_exception_handler
 from crud import (
@@ -160,17 +162,15 @@ async def info_faq(
     await state.clear()
 
     question_type = callback.data
-    question_list = [
-        question.question
-        for question in await info_crud.get_all_questions_by_type(
-            question_type=question_type, session=session
-        )
-    ]
+    questions = await info_crud.get_all_questions_by_type(
+        question_type=question_type, session=session
+    )
 
     await callback.message.edit_text(
         callback.data,
         reply_markup=await get_inline_keyboard(
-            options=question_list,
+            options=[question.question for question in questions],
+            callback=get_object_callbacks(questions),
             previous_menu=MAIN_MENU_OPTIONS.get("support"),
             admin_update_menu=callback.data,
         ),
@@ -217,7 +217,7 @@ async def get_products_list(
 ):
     """Получить список продуктов."""
     products: list[ProductCategory] = await products_crud.get_multi(session)
-    product_names, product_id = extract_and_unpack(products, "name", "id")
+    product_names = [product.name for product in products]
 
     await state.clear()
 
@@ -225,7 +225,7 @@ async def get_products_list(
         PRODUCT_LIST_TEXT,
         reply_markup=await get_inline_keyboard(
             product_names,
-            callback=product_id,
+            callback=get_object_callbacks(products),
             previous_menu=MAIN_MENU_TEXT,
             admin_update_menu=callback.data,
         ),
@@ -239,12 +239,19 @@ async def get_products_list(
 @message_exception_handler(
     log_error_text="Ошибка при получении списка дополнительных вариантов продукта"
 )
-@admin_main_router.callback_query(ProductCategoryStates.category, F.data)
+@admin_main_router.callback_query(
+    ProductCategoryStates.category, AdminObjectCallback.filter()
+)
 async def product_category(
-    callback: CallbackQuery, session: AsyncSession, state: FSMContext
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    session: AsyncSession,
+    state: FSMContext,
 ):
     """Получить список дополнительных вариантов продукта."""
-    product: ProductCategory = await products_crud.get(callback.data, session)
+    product: ProductCategory = await products_crud.get(
+        callback_data.obj_id, session
+    )
     categories = await category_product_crud.get_category_by_product_id(
         product.id, session
     )
@@ -253,9 +260,10 @@ async def product_category(
         f"{product.description}",
         reply_markup=await get_inline_keyboard(
             categories_name,
+            callback=get_object_callbacks(categories),
             urls=urls,
             previous_menu=MAIN_MENU_OPTIONS.get("products"),
-            admin_update_menu=callback.data,
+            admin_update_menu=product.id,
         ),
     )
     logger.info(
@@ -268,16 +276,16 @@ async def product_category(
 @message_exception_handler(
     log_error_text="Ошибка при получении данных варианта продукта"
 )
-@admin_main_router.callback_query(ProductCategoryStates.product_id, F.data)
+@admin_main_router.callback_query(
+    ProductCategoryStates.product_id, AdminObjectCallback.filter()
+)
 async def get_product_info(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    session: AsyncSession,
 ):
     """Получить данные варианта продукта."""
-    state_data = await state.get_data()
-    product_id = state_data.get("product_id")
-    category = await category_product_crud.get_category_by_name(
-        product_id=product_id, field_name=callback.data, session=session
-    )
+    category = await category_product_crud.get(callback_data.obj_id, session)
     if category.media:
         await callback.message.answer_photo(
             photo=category.media,
@@ -297,26 +305,24 @@ async def get_product_info(
 @message_exception_handler(
     log_error_text="Ошибка при получении ответа на вопрос из раздела Техподдержка"
 )
-@admin_main_router.callback_query(QuestionAnswer.question, F.data)
+@admin_main_router.callback_query(
+    QuestionAnswer.question, AdminObjectCallback.filter()
+)
 async def faq_answer(
-    callback: CallbackQuery, session: AsyncSession, state: FSMContext
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    session: AsyncSession,
+    state: FSMContext,
 ):
     """Получить ответ на вопрос из раздела Техподдержка."""
-    question_list = [
-        question.question for question in await info_crud.get_multi(session)
-    ]
-
-    if callback.data not in question_list:
-        return
-
-    question = await info_crud.get_by_string(callback.data, session)
-    answer = f"{callback.data}\n\n{question.answer}"
+    question = await info_crud.get(callback_data.obj_id, session)
+    answer = f"{question.question}\n\n{question.answer}"
 
     await callback.message.answer(
         answer,
         reply_markup=await get_delete_message_keyboard(),
     )
     logger.info(
-        f"Пользователь {callback.from_user.id} получил ответ на вопрос: {callback.data}."
+        f"Пользователь {callback.from_user.id} получил ответ на вопрос: {question.question}."
     )
     await state.clear()
@@ -1,7 +1,7 @@
 import logging
 
 from aiogram import F, Router
-from aiogram.filters import and_f, or_f
+from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
@@ -11,6 +11,7 @@ from admin.handlers.admin_handlers.admin import SectionState
 from bot.exceptions import message_exception_handler
 from crud import portfolio_crud
 from admin.filters.filters import ChatTypeFilter, IsManagerOrAdmin
+from admin.keyboards.keyboards import AdminObjectCallback
 from admin.admin_managers import (
     DeleteManager,
     CreateManager,
@@ -131,13 +132,18 @@ async def portfolio_project_to_delete(
     log_error_text="Ошибка при подтверждении удаления проекта"
 )
 @portfolio_router.callback_query(
-    PortfolioDeleteState.select, F.data != PREVIOUS_MENU
+    PortfolioDeleteState.select, AdminObjectCallback.filter()
 )
 async def confirm_delete(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+    session: AsyncSession,
 ):
     """Подтвердить удаление выбранного объекта."""
-    await portfolio_delete_manager.confirm_delete(callback, state, session)
+    await portfolio_delete_manager.confirm_delete(
+        callback, callback_data, state, session
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} подтвердил удаление проекта."
     )
@@ -177,18 +183,17 @@ async def portfolio_project_to_update(
     log_error_text="Ошибка при выборе данных для обновления"
 )
 @portfolio_router.callback_query(
-    PortfolioUpdateState.select,
-    and_f(
-        F.data != ADMIN_UPDATE_OPTIONS.get("name"),
-        F.data != ADMIN_UPDATE_OPTIONS.get("content"),
-        F.data != PREVIOUS_MENU,
-    ),
+    PortfolioUpdateState.select, AdminObjectCallback.filter()
 )
 async def update_portfolio_project_choice(
-    callback: CallbackQuery, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
 ):
     """Обработать выбор данных для обновления."""
-    await portfolio_update_manager.select_data_to_update(callback, session)
+    await portfolio_update_manager.select_data_to_update(
+        callback, callback_data, state
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} выбрал данные для обновления."
     )
@@ -203,9 +208,10 @@ async def update_portfolio_project_choice(
 async def portfolio_name_update(
     callback: CallbackQuery,
     state: FSMContext,
+    session: AsyncSession,
 ):
     """Обновить имя объекта."""
-    await portfolio_update_manager.change_obj_name(callback, state)
+    await portfolio_update_manager.change_obj_name(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} обновил имя объекта портфолио."
     )
@@ -217,9 +223,13 @@ async def portfolio_name_update(
 @portfolio_router.callback_query(
     PortfolioUpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("content")
 )
-async def about_url_update(callback: CallbackQuery, state: FSMContext):
+async def about_url_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Обновить содержимое объекта."""
-    await portfolio_update_manager.change_obj_content(callback, state)
+    await portfolio_update_manager.change_obj_content(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} обновил содержимое объекта портфолио."
     )
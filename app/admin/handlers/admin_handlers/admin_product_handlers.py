@@ -1,7 +1,7 @@
 import logging
 
 from aiogram import F, Router
-from aiogram.filters import or_f, and_f
+from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
@@ -12,6 +12,7 @@ from bot.exceptions import message_exception_handler
 from .admin import SectionState
 from crud import products_crud
 from admin.filters.filters import ChatTypeFilter, IsManagerOrAdmin
+from admin.keyboards.keyboards import AdminObjectCallback
 from admin.admin_managers import (
     CreateManager,
     UpdateManager,
@@ -118,13 +119,18 @@ async def product_to_delete(
     log_error_text="Ошибка при подтверждении удаления продукта"
 )
 @product_router.callback_query(
-    ProductDeleteState.select, F.data != PREVIOUS_MENU
+    ProductDeleteState.select, AdminObjectCallback.filter()
 )
 async def confirm_delete(
-    callback: CallbackQuery, state: FSMContext, session: AsyncSession
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+    session: AsyncSession,
 ):
     """Подтверждение удаления."""
-    await product_delete_manager.confirm_delete(callback, state, session)
+    await product_delete_manager.confirm_delete(
+        callback, callback_data, state, session
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} подтвердил удаление продукта."
     )
@@ -162,16 +168,17 @@ async def product_to_update(
     log_error_text="Ошибка при выборе поля для редактирования"
 )
 @product_router.callback_query(
-    ProductUpdateState.select,
-    and_f(
-        F.data != ADMIN_UPDATE_OPTIONS.get("name"),
-        F.data != ADMIN_UPDATE_OPTIONS.get("content"),
-        F.data != PREVIOUS_MENU,
-    ),
-)
-async def update_choice(callback: CallbackQuery, session: AsyncSession):
+    ProductUpdateState.select, AdminObjectCallback.filter()
+)
+async def update_choice(
+    callback: CallbackQuery,
+    callback_data: AdminObjectCallback,
+    state: FSMContext,
+):
     """Выбор поля для редактирования."""
-    await product_update_manager.select_data_to_update(callback, session)
+    await product_update_manager.select_data_to_update(
+        callback, callback_data, state
+    )
     logger.info(
         f"Пользователь {callback.from_user.id} выбрал поле для редактирования."
     )
@@ -183,9 +190,13 @@ async def update_choice(callback: CallbackQuery, session: AsyncSession):
 @product_router.callback_query(
     ProductUpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("name")
 )
-async def about_name_update(callback: CallbackQuery, state: FSMContext):
+async def about_name_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Ввести новое название продукта."""
-    await product_update_manager.change_obj_name(callback, state)
+    await product_update_manager.change_obj_name(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} ввел новое название продукта."
     )
@@ -197,9 +208,13 @@ async def about_name_update(callback: CallbackQuery, state: FSMContext):
 @product_router.callback_query(
     ProductUpdateState.select, F.data == ADMIN_UPDATE_OPTIONS.get("content")
 )
-async def about_url_update(callback: CallbackQuery, state: FSMContext):
+async def about_url_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession,
+):
     """Ввести новое описание продукта."""
-    await product_update_manager.change_obj_content(callback, state)
+    await product_update_manager.change_obj_content(callback, state, session)
     logger.info(
         f"Пользователь {callback.from_user.id} ввел новое описание продукта."
     )
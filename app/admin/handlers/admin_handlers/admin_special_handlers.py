@@ -24,9 +24,8 @@ from bot.exceptions import message_exception_handler
 from models.models import ContactManager, Feedback
 from crud.request_to_manager import (
     close_case,
-    get_all_manager_requests,
-    get_all_support_requests,
     get_request,
+    get_requests_page,
 )
 from crud import feedback_crud
 
@@ -67,6 +66,20 @@ async def get_requests_data(
     return options, request_ids
 
 
+def get_page_cursors(
+    page_objects: list, has_more: bool, cursor: int | None, backward: bool
+) -> tuple[int | None, int | None]:
+    """Курсоры для кнопок 'Назад' и 'Далее' на странице списка."""
+    if not page_objects:
+        return None, None
+    if backward:
+        prev_cursor = page_objects[0].id if has_more else None
+        return prev_cursor, page_objects[-1].id
+    prev_cursor = page_objects[0].id if cursor is not None else None
+    next_cursor = page_objects[-1].id if has_more else None
+    return prev_cursor, next_cursor
+
+
 async def get_feedbacks_data(
     feedback_list: list[Feedback],
 ) -> tuple[list[str]]:
@@ -94,15 +107,39 @@ async def get_admin_special_options(callback: CallbackQuery):
     logger.info(f"Пользователь {callback.from_user.id} открыл админское меню.")
 
 
+REQUEST_PAGES = {
+    RequestState.manager_request.state: (
+        ContactManager.need_contact_with_manager,
+        ADMIN_SPECIAL_OPTIONS.get("manager_request"),
+    ),
+    RequestState.support_request.state: (
+        ContactManager.need_support,
+        ADMIN_SPECIAL_OPTIONS.get("support_request"),
+    ),
+}
+
+
 async def display_requests_page(
-    callback: CallbackQuery, options, callbacks, page, title
+    callback: CallbackQuery,
+    request_state: str,
+    session: AsyncSession,
+    cursor: int | None = None,
+    backward: bool = False,
 ):
+    need_column, title = REQUEST_PAGES[request_state]
+    request_list, has_more = await get_requests_page(
+        need_column, session, cursor, backward, REQUESTS_PER_PAGE
+    )
+    options, callbacks = await get_requests_data(request_list)
+    prev_cursor, next_cursor = get_page_cursors(
+        request_list, has_more, cursor, backward
+    )
     keyboard = await get_paginated_inline_keyboard(
         options=options,
         callback=callbacks,
-        items_per_page=REQUESTS_PER_PAGE,
-        page=page,
         previous_menu=PREVIOUS_MENU,
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
     )
     await callback.message.edit_text(
         title,
@@ -119,15 +156,8 @@ async def display_requests_page(
 async def get_manager_request_list(
     callback: CallbackQuery, state: FSMContext, session: AsyncSession
 ):
-    request_list = await get_all_manager_requests(session)
-    options, callbacks = await get_requests_data(request_list)
-    current_page = 0
     await display_requests_page(
-        callback,
-        options,
-        callbacks,
-        current_page,
-        ADMIN_SPECIAL_OPTIONS.get("manager_request"),
+        callback, RequestState.manager_request.state, session
     )
     await state.set_state(RequestState.manager_request)
     logger.info(
@@ -144,15 +174,8 @@ async def get_manager_request_list(
 async def get_support_request_list(
     callback: CallbackQuery, state: FSMContext, session: AsyncSession
 ):
-    request_list = await get_all_support_requests(session)
-    options, callbacks = await get_requests_data(request_list)
-    current_page = 0
     await display_requests_page(
-        callback,
-        options,
-        callbacks,
-        current_page,
-        ADMIN_SPECIAL_OPTIONS.get("support_request"),
+        callback, RequestState.support_request.state, session
     )
     await state.set_state(RequestState.support_request)
     logger.info(
@@ -213,23 +236,30 @@ async def close_request(
 async def get_feedbacks(
     callback: CallbackQuery, state: FSMContext, session: AsyncSession
 ):
-    feedbacks = await feedback_crud.get_multi(session)
-    options, callbacks = await get_feedbacks_data(feedbacks)
-    current_page = 0
-    await display_feedbacks_page(callback, options, callbacks, current_page)
+    await display_feedbacks_page(callback, session)
     await state.set_state(FeedbackState.feedback)
     logger.info(f"Пользователь {callback.from_user.id} запросил все отзывы.")
 
 
 async def display_feedbacks_page(
-    callback: CallbackQuery, options, callbacks, page
+    callback: CallbackQuery,
+    session: AsyncSession,
+    cursor: int | None = None,
+    backward: bool = False,
 ):
+    feedbacks, has_more = await feedback_crud.get_page(
+        session, cursor, backward, FEEDBACKS_PER_PAGE
+    )
+    options, callbacks = await get_feedbacks_data(feedbacks)
+    prev_cursor, next_cursor = get_page_cursors(
+        feedbacks, has_more, cursor, backward
+    )
     keyboard = await get_paginated_inline_keyboard(
         options=options,
         callback=callbacks,
-        items_per_page=FEEDBACKS_PER_PAGE,
-        page=page,
         previous_menu=PREVIOUS_MENU,
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
     )
     await callback.message.edit_text(
         ADMIN_SPECIAL_OPTIONS.get("feedbacks"),
@@ -241,33 +271,16 @@ async def display_feedbacks_page(
 async def handle_page_navigation(
     callback: CallbackQuery, state: FSMContext, session: AsyncSession
 ):
-    page = int(callback.data.split("_")[1])
-
-    if FeedbackState.feedback.state == await state.get_state():
-        feedbacks = await feedback_crud.get_multi(session)
-        options, callbacks = await get_feedbacks_data(feedbacks)
-        await display_feedbacks_page(callback, options, callbacks, page)
+    _, direction, cursor = callback.data.split("_")
+    backward = direction == "prev"
+    current_state = await state.get_state()
 
-    elif RequestState.manager_request.state == await state.get_state():
-        request_list = await get_all_manager_requests(session)
-        options, callbacks = await get_requests_data(request_list)
-        await display_requests_page(
-            callback,
-            options,
-            callbacks,
-            page,
-            ADMIN_SPECIAL_OPTIONS.get("manager_request"),
-        )
+    if FeedbackState.feedback.state == current_state:
+        await display_feedbacks_page(callback, session, int(cursor), backward)
 
-    elif RequestState.support_request.state == await state.get_state():
-        request_list = await get_all_support_requests(session)
-        options, callbacks = await get_requests_data(request_list)
+    elif current_state in REQUEST_PAGES:
         await display_requests_page(
-            callback,
-            options,
-            callbacks,
-            page,
-            ADMIN_SPECIAL_OPTIONS.get("support_request"),
+            callback, current_state, session, int(cursor), backward
         )
 
 
@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 
 from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message
@@ -9,9 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin.filters.filters import ChatTypeFilter, IsAdminOnly
 from admin.keyboards.keyboards import (
+    get_inline_confirmation,
     get_inline_keyboard,
 )
 from admin.admin_settings import (
+    BROADCAST_CONFIRM,
     DATETIME_FORMAT,
     MAIN_MENU_OPTIONS,
     MAIN_MENU_TEXT,
@@ -20,7 +23,9 @@ from admin.admin_settings import (
     SUPERUSER_SPECIAL_BUTTONS,
     SUPERUSER_SPECIAL_OPTIONS,
 )
-from redis_db.connect import get_redis_connection
+from core.db import run_after_commit
+from redis_db.create_timer import set_user_timeout
+from bot.broadcast import RUNNING, broadcaster, get_progress_text
 from bot.exceptions import message_exception_handler
 from models.models import User, RoleEnum
 from crud.request_to_manager import get_manager_stats
@@ -39,6 +44,11 @@ timer = State()
 manager = State()
 
 
+class BroadcastState(StatesGroup):
+    text = State()
+    confirm = State()
+
+
 class RoleState(StatesGroup):
     manager = State()
     admin = State()
@@ -225,7 +235,7 @@ async def check_user_and_make_him_manager(
     current_state = await state.get_state()
     fsm_data = await state.get_data()
     user_tg_id = fsm_data.get("tg_id", message.text)
-    user_new_role = fsm_data.get("role")
+    user_new_role = RoleEnum(fsm_data.get("role"))
     user, error_message = await check_user_tg_id_data(user_tg_id, session)
     if error_message:
         await message.answer(
@@ -239,10 +249,16 @@ async def check_user_and_make_him_manager(
             await user_crud.update(user, user_new_role, session)
         elif current_state == RoleState.name:
             await user_crud.update(user, user_new_role, session, message.text)
-        await message.answer(
-            f"Новая роль пользователя {user.tg_id} - {user_new_role}",
-            reply_markup=await get_inline_keyboard(
-                previous_menu=SUPERUSER_PROMOTION_OPTIONS.get("manager_list")
+        await run_after_commit(
+            session,
+            partial(
+                message.answer,
+                f"Новая роль пользователя {user.tg_id} - {user_new_role}",
+                reply_markup=await get_inline_keyboard(
+                    previous_menu=SUPERUSER_PROMOTION_OPTIONS.get(
+                        "manager_list"
+                    )
+                ),
             ),
         )
         logger.info(
@@ -271,10 +287,7 @@ async def change_inactivity_timer(callback: CallbackQuery, state: FSMContext):
 @superuser_router.message(timer, F.text.isnumeric())
 async def check_and_set_new_timer(message: Message, state: FSMContext):
     """Проверить и выставить новый таймер."""
-    redis_client = await get_redis_connection()
-
-    await redis_client.set("timeout", int(message.text))
-    await redis_client.close()
+    await set_user_timeout(message.from_user.id, int(message.text))
     await message.answer(
         f"Новый таймер на {message.text} секунд установлен!",
         reply_markup=await get_inline_keyboard(previous_menu=PREVIOUS_MENU),
@@ -283,3 +296,68 @@ async def check_and_set_new_timer(message: Message, state: FSMContext):
     logger.info(
         f"Пользователь {message.from_user.id} изменил таймер на {message.text}."
     )
+
+
+@message_exception_handler(log_error_text="Ошибка при открытии рассылки.")
+@superuser_router.callback_query(
+    F.data == SUPERUSER_SPECIAL_OPTIONS.get("broadcast")
+)
+async def get_broadcast_text(callback: CallbackQuery, state: FSMContext):
+    """Показать ход рассылки или запросить текст новой."""
+    progress = await broadcaster.get_progress()
+    if progress.get("status") == RUNNING:
+        # Если рассылку никто не ведёт, продолжить её в этом процессе.
+        broadcaster.start()
+        await callback.message.edit_text(
+            get_progress_text(progress),
+            reply_markup=await get_inline_keyboard(
+                previous_menu=PREVIOUS_MENU
+            ),
+        )
+        return
+    last_broadcast = f"{get_progress_text(progress)}\n\n" if progress else ""
+    await callback.message.edit_text(
+        f"{last_broadcast}Введите текст сообщения для всех пользователей:",
+        reply_markup=await get_inline_keyboard(previous_menu=PREVIOUS_MENU),
+    )
+    await state.set_state(BroadcastState.text)
+    logger.info(f"Пользователь {callback.from_user.id} готовит рассылку.")
+
+
+@message_exception_handler(log_error_text="Ошибка при вводе текста рассылки.")
+@superuser_router.message(BroadcastState.text, F.text)
+async def confirm_broadcast(message: Message, state: FSMContext):
+    """Подтвердить текст рассылки."""
+    await state.update_data(broadcast_text=message.text)
+    await message.answer(
+        f"Отправить это сообщение всем пользователям?\n\n{message.text}",
+        reply_markup=await get_inline_confirmation(
+            cancel_option=PREVIOUS_MENU, option=BROADCAST_CONFIRM
+        ),
+    )
+    await state.set_state(BroadcastState.confirm)
+
+
+@message_exception_handler(log_error_text="Ошибка при запуске рассылки.")
+@superuser_router.callback_query(
+    BroadcastState.confirm, F.data == BROADCAST_CONFIRM
+)
+async def start_broadcast(callback: CallbackQuery, state: FSMContext):
+    """Запустить рассылку всем пользователям."""
+    fsm_data = await state.get_data()
+    await state.clear()
+    is_started = await broadcaster.start_broadcast(
+        fsm_data.get("broadcast_text"), callback.from_user.id
+    )
+    await callback.message.edit_text(
+        (
+            "Рассылка запущена. Итог придёт отдельным сообщением."
+            if is_started
+            else "Рассылка уже идёт, дождитесь её окончания."
+        ),
+        reply_markup=await get_inline_keyboard(previous_menu=PREVIOUS_MENU),
+    )
+    logger.info(
+        f"Пользователь {callback.from_user.id} запустил рассылку: "
+        f"{is_started}."
+    )
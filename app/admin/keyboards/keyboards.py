@@ -1,7 +1,24 @@
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 
+class AdminObjectCallback(CallbackData, prefix="admin_obj"):
+    """
+    Коллбек-данные кнопки объекта БД в админ-меню.
+
+    Кнопка несёт первичный ключ объекта, а не его название:
+    поиск идёт по id и не зависит от длины и уникальности названий.
+    """
+
+    obj_id: int
+
+
+def get_object_callbacks(objects) -> list[str]:
+    """Коллбек-данные для кнопок списка объектов БД."""
+    return [AdminObjectCallback(obj_id=obj.id).pack() for obj in objects]
+
+
 class InlineKeyboardManager:
     """
     Менеджер для создания инлайн-клавиатур.
@@ -73,6 +90,9 @@ class InlineKeyboardManager:
 class PaginatedInlineKeyboardManager(InlineKeyboardManager):
     """
     Менеджер для создания инлайн-клавиатур с поддержкой пагинации.
+
+    Клавиатура получает уже выбранную страницу. Кнопки навигации
+    передают курсор: id первого или последнего объекта на странице.
     """
 
     def __init__(
@@ -80,59 +100,48 @@ class PaginatedInlineKeyboardManager(InlineKeyboardManager):
         options=None,
         callback=None,
         urls=None,
-        size=[
-            1,
-        ],
         previous_menu=None,
         admin_update_menu=None,
-        items_per_page=5,
+        prev_cursor=None,
+        next_cursor=None,
     ):
         super().__init__(
-            options, callback, urls, size, previous_menu, admin_update_menu
+            options,
+            callback,
+            urls,
+            previous_menu=previous_menu,
+            admin_update_menu=admin_update_menu,
         )
-        self.items_per_page = items_per_page
-
-    def create_keyboard(self, page=0) -> InlineKeyboardMarkup:
-        """Создать клавиатуру с учетом пагинации и вернуть ее."""
-        start_index = page * self.items_per_page
-        end_index = start_index + self.items_per_page
-        paginated_options = self.options[start_index:end_index]
-        paginated_callbacks = self.callback[start_index:end_index]
-        paginated_urls = self.urls[start_index:end_index]
-        for index, option in enumerate(paginated_options):
-            self.keyboard.add(
-                InlineKeyboardButton(
-                    text=option,
-                    callback_data=str(paginated_callbacks[index]),
-                    url=(paginated_urls[index] if paginated_urls else None),
-                )
-            )
+        self.prev_cursor = prev_cursor
+        self.next_cursor = next_cursor
+
+    def create_keyboard(self) -> InlineKeyboardMarkup:
+        """Создать клавиатуру страницы и вернуть ее."""
+        self.add_buttons()
         nav_buttons = []
-        if page > 0:
+        if self.prev_cursor is not None:
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="◀️Назад",
-                    callback_data=f"page_{page - 1}",
+                    callback_data=f"page_prev_{self.prev_cursor}",
                 )
             )
-        if end_index < len(self.options):
+        if self.next_cursor is not None:
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="Далее▶️",
-                    callback_data=f"page_{page + 1}",
+                    callback_data=f"page_next_{self.next_cursor}",
                 )
             )
-        if nav_buttons:
-            self.keyboard.row(*nav_buttons)
+        self.keyboard.add(*nav_buttons)
         self.add_back_button()
-        size_list = (
-            [1] * self.items_per_page + [2]
-            if page > 0 and page < end_index
-            else [1]
+        size_list = [1] * len(self.options)
+        if nav_buttons:
+            size_list.append(len(nav_buttons))
+        size_list.append(1)
+        return self.keyboard.adjust(*size_list).as_markup(
+            resize_keyboard=True
         )
-        self.size = size_list
-
-        return self.keyboard.adjust(*self.size).as_markup(resize_keyboard=True)
 
 
 async def get_inline_keyboard(
@@ -165,17 +174,17 @@ async def get_paginated_inline_keyboard(
     urls=None,
     previous_menu=None,
     admin_update_menu=None,
-    items_per_page=5,
-    page=0,
+    prev_cursor=None,
+    next_cursor=None,
 ):
-    """Создать инлайн-клавиатуру с пагинацией.
+    """Создать инлайн-клавиатуру страницы с кнопками навигации.
 
-    :param options: Список названий кнопок.
+    :param options: Список названий кнопок на странице.
     :param callback: Список коллбек-данных для кнопок.
     :param urls: Список URL для кнопок.
     :param previous_menu: Коллбек-данные для кнопки "Назад".
-    :param items_per_page: Количество кнопок на одной странице.
-    :param page: Номер текущей страницы.
+    :param prev_cursor: Курсор предыдущей страницы или None.
+    :param next_cursor: Курсор следующей страницы или None.
     :return: Объект InlineKeyboardMarkup.
     """
     return PaginatedInlineKeyboardManager(
@@ -184,8 +193,9 @@ async def get_paginated_inline_keyboard(
         urls=urls,
         previous_menu=previous_menu,
         admin_update_menu=admin_update_menu,
-        items_per_page=items_per_page,
-    ).create_keyboard(page=page)
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
+    ).create_keyboard()
 
 
 async def get_delete_message_keyboard() -> InlineKeyboardMarkup:
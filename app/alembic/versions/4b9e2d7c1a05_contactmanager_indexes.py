@@ -0,0 +1,73 @@
+"""contactmanager indexes
+
+Revision ID: 4b9e2d7c1a05
+Revises: 17c3c5e67c14
+Create Date: 2026-10-18 13:40:12.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b9e2d7c1a05'
+down_revision: Union[str, None] = '17c3c5e67c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contactmanager_open_support',
+            'contactmanager',
+            ['id'],
+            postgresql_where=sa.text(
+                'shipping_date_close IS NULL AND need_support IS true'
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_contactmanager_open_manager',
+            'contactmanager',
+            ['id'],
+            postgresql_where=sa.text(
+                'shipping_date_close IS NULL '
+                'AND need_contact_with_manager IS true'
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_contactmanager_manager_id_closed',
+            'contactmanager',
+            ['manager_id', sa.text('shipping_date_close DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contactmanager_manager_id_closed',
+            table_name='contactmanager',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_contactmanager_open_manager',
+            table_name='contactmanager',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_contactmanager_open_support',
+            table_name='contactmanager',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
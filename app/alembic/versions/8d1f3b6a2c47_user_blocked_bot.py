@@ -0,0 +1,35 @@
+"""user blocked_bot
+
+Revision ID: 8d1f3b6a2c47
+Revises: 4b9e2d7c1a05
+Create Date: 2026-10-18 18:05:37.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1f3b6a2c47'
+down_revision: Union[str, None] = '4b9e2d7c1a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Константный server_default не переписывает таблицу в PostgreSQL 11+.
+    op.add_column(
+        'user',
+        sa.Column(
+            'blocked_bot',
+            sa.BOOLEAN(),
+            server_default=sa.false(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'blocked_bot')
@@ -0,0 +1,113 @@
+"""
+Планы горячих запросов к заявкам (contactmanager) до и после индексов.
+
+Запуск из папки app на тестовой БД с применёнными миграциями:
+
+    python -m benchmarks.contact_manager_plans --rows 200000
+
+Скрипт в одной транзакции наполняет таблицу синтетическими заявками,
+выводит EXPLAIN ANALYZE запросов с индексами, затем удаляет индексы
+и выводит планы ещё раз. В конце транзакция откатывается, данные
+и индексы остаются прежними. DROP INDEX блокирует таблицу до конца
+транзакции, поэтому на рабочей БД скрипт не запускать.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from core.db import engine
+
+INDEXES = (
+    "ix_contactmanager_open_support",
+    "ix_contactmanager_open_manager",
+    "ix_contactmanager_manager_id_closed",
+)
+
+# Тот же SQL, что строят функции из crud/request_to_manager.py.
+QUERIES = {
+    "Открытые заявки на техподдержку (страница)": (
+        "SELECT * FROM contactmanager "
+        "WHERE shipping_date_close IS NULL AND need_support IS true "
+        "AND id > :cursor ORDER BY id LIMIT 6"
+    ),
+    "Открытые заявки на звонок менеджера (страница)": (
+        "SELECT * FROM contactmanager "
+        "WHERE shipping_date_close IS NULL "
+        "AND need_contact_with_manager IS true "
+        "AND id > :cursor ORDER BY id LIMIT 6"
+    ),
+    "Число закрытых заявок менеджера": (
+        "SELECT count(*) FROM contactmanager WHERE manager_id = :manager_id"
+    ),
+    "Последняя закрытая заявка менеджера": (
+        "SELECT * FROM contactmanager WHERE manager_id = :manager_id "
+        "ORDER BY shipping_date_close DESC LIMIT 1"
+    ),
+}
+
+MANAGERS_COUNT = 50
+FIRST_MANAGER_TG_ID = 9_000_000_000
+
+SEED_MANAGERS = text(
+    'INSERT INTO "user" (tg_id, name, role) '
+    "SELECT CAST(:first_tg_id AS bigint) + g, 'benchmark', 'MANAGER' "
+    "FROM generate_series(1, :managers) AS g "
+    "ON CONFLICT (tg_id) DO NOTHING"
+)
+
+# Примерно 2% заявок остаются открытыми, как в рабочей базе.
+SEED_REQUESTS = text(
+    "INSERT INTO contactmanager (first_name, phone_number, need_support, "
+    "need_contact_with_manager, shipping_date, shipping_date_close, "
+    "manager_id) "
+    "SELECT 'benchmark', '+70000000000', g % 2 = 0, g % 2 = 1, "
+    "now() - g * interval '1 minute', "
+    "CASE WHEN g % 50 = 0 THEN NULL "
+    "ELSE now() - g * interval '1 minute' + interval '1 hour' END, "
+    "CASE WHEN g % 50 = 0 THEN NULL "
+    "ELSE CAST(:first_tg_id AS bigint) + 1 + g % :managers END "
+    "FROM generate_series(1, :rows) AS g"
+)
+
+
+async def print_plans(connection, title: str) -> None:
+    print(f"\n===== {title} =====")
+    for name, query in QUERIES.items():
+        result = await connection.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"),
+            {"cursor": 0, "manager_id": FIRST_MANAGER_TG_ID + 1},
+        )
+        print(f"\n--- {name}")
+        for (line,) in result:
+            print(line)
+
+
+async def main(rows: int) -> None:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            params = {
+                "rows": rows,
+                "managers": MANAGERS_COUNT,
+                "first_tg_id": FIRST_MANAGER_TG_ID,
+            }
+            await connection.execute(SEED_MANAGERS, params)
+            await connection.execute(SEED_REQUESTS, params)
+            await connection.execute(text("ANALYZE contactmanager"))
+            await print_plans(connection, "С индексами")
+
+            for index in INDEXES:
+                await connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            await connection.execute(text("ANALYZE contactmanager"))
+            await print_plans(connection, "Без индексов")
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    asyncio.run(main(parser.parse_args().rows))
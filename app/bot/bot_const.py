@@ -42,6 +42,16 @@ MESSAGE_FOR_PRODUCTS_SERVICES: str = (
     "Какой из них вас интересует? "
 )
 
+# Префиксы callback_data с параметром после двоеточия. Используются
+# и в клавиатурах, и в фильтрах обработчиков, и в индексе маршрутизации.
+CATEGORY_CALLBACK: str = "category:"
+
+ANSWER_CALLBACK: str = "answer:"
+
+SHOW_CATEGORY_CALLBACK: str = "show_category:"
+
+BACK_CALLBACK: str = "back:"
+
 
 class Form(StatesGroup):
     """Форма для связи с менеджером."""
@@ -59,6 +69,12 @@ QUESTIONS: dict[Form, str] = {
 }
 
 
+REQUEST_TYPE_TITLES: dict[str, str] = {
+    "contact_manager": "Связаться с менеджером",
+    "callback_request": "Запрос на обратный звонок",
+}
+
+
 def succses_answer(user_data: dict) -> str:
     return (
         f"Спасибо! Наш менеджер свяжется "
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import os
+import socket
+
+from aiogram.exceptions import TelegramForbiddenError
+
+from core.bot_setup import bot
+from core.db import AsyncSessionLocal
+from core.metrics import Counter
+from core.settings import settings
+from crud import user_crud
+from middlewares.middleware import TokenBucket
+from redis_db.connect import get_redis_connection
+from redis_db.inactivity import RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+# Прогресс текущей рассылки: текст, последний обработанный id
+# пользователя, счётчики и статус.
+BROADCAST_KEY = "broadcast:current"
+# Рассылку ведёт только один процесс, даже при нескольких репликах.
+BROADCAST_LOCK = "broadcast:lock"
+
+RUNNING = "running"
+FINISHED = "finished"
+ABORTED = "aborted"
+
+SENT = "sent"
+BLOCKED = "blocked"
+FAILED = "failed"
+
+broadcast_messages_total = Counter(
+    "broadcast_messages_total",
+    "Сколько сообщений рассылки отправлено.",
+)
+
+
+def get_progress_text(progress: dict) -> str:
+    """Текст о ходе рассылки для администратора."""
+
+    status = {
+        RUNNING: "идёт",
+        FINISHED: "завершена",
+        ABORTED: "прервана из-за ошибки",
+    }.get(progress.get("status"), "завершена")
+    return (
+        f"Рассылка {status}.\n\n"
+        f"Отправлено: {progress.get(SENT, 0)}\n"
+        f"Заблокировали бота: {progress.get(BLOCKED, 0)}\n"
+        f"Ошибок: {progress.get(FAILED, 0)}"
+    )
+
+
+class Broadcaster:
+    """
+    Рассылка сообщения всем пользователям бота.
+
+    Получатели читаются из БД порциями по chunk_size (WHERE id > last_id
+    ORDER BY id LIMIT chunk_size) в коротких сессиях и отправляются
+    через workers параллельных отправок с общим темпом rate сообщений
+    в секунду, оставляя часть лимита Telegram обычным ответам бота.
+    После каждой порции последний id сохраняется в Redis, поэтому после
+    ошибки или падения процесса рассылка продолжается с места
+    остановки. Рассылку ведёт только процесс, удерживающий блокировку.
+    Пользователи, которые заблокировали бота, отмечаются в БД
+    и в следующие рассылки не попадают.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20,
+        workers: int = 5,
+        chunk_size: int = 100,
+        lock_ttl: float = 60,
+        max_retries: int = 5,
+        retry_delay: float = 5,
+    ) -> None:
+        self.bucket = TokenBucket(rate)
+        self.chunk_size = chunk_size
+        self.lock_ttl_ms = int(lock_ttl * 1000)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._semaphore = asyncio.Semaphore(workers)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def get_progress(self) -> dict:
+        """Прогресс текущей или последней рассылки."""
+
+        return await get_redis_connection().hgetall(BROADCAST_KEY)
+
+    async def start_broadcast(self, text: str, admin_id: int) -> bool:
+        """
+        Начать рассылку. Возвращает False, если рассылка уже идёт.
+
+        Блокировка берётся до записи прогресса, поэтому из двух
+        одновременных запусков на разных репликах проходит один.
+        Незавершённая рассылка упавшего процесса не перезаписывается,
+        а продолжается.
+        """
+
+        redis = get_redis_connection()
+        if self.is_running or not await self._acquire_lock(redis):
+            return False
+        if await redis.hget(BROADCAST_KEY, "status") == RUNNING:
+            self._task = asyncio.create_task(self._run(is_locked=True))
+            return False
+        await redis.delete(BROADCAST_KEY)
+        await redis.hset(
+            BROADCAST_KEY,
+            mapping={
+                "text": text,
+                "admin_id": admin_id,
+                "last_id": 0,
+                SENT: 0,
+                BLOCKED: 0,
+                FAILED: 0,
+                "status": RUNNING,
+            },
+        )
+        self._task = asyncio.create_task(self._run(is_locked=True))
+        return True
+
+    def start(self) -> None:
+        """Продолжить прерванную рассылку, если она есть."""
+
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить рассылку, сохранив прогресс."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _acquire_lock(self, redis) -> bool:
+        return bool(
+            await redis.set(
+                BROADCAST_LOCK, self.consumer, nx=True, px=self.lock_ttl_ms
+            )
+        )
+
+    async def _release_lock(self, redis) -> None:
+        await redis.eval(
+            RELEASE_LEASE_SCRIPT, 1, BROADCAST_LOCK, self.consumer
+        )
+
+    async def _keep_lock(self, redis) -> None:
+        """
+        Продлевать блокировку, пока идёт рассылка.
+
+        Продление не зависит от отправки, поэтому долгая пауза после
+        ответа 429 не отпускает блокировку. Возвращается, если
+        блокировка потеряна.
+        """
+
+        while True:
+            await asyncio.sleep(self.lock_ttl_ms / 3000)
+            try:
+                renewed = await redis.eval(
+                    RENEW_LEASE_SCRIPT,
+                    1,
+                    BROADCAST_LOCK,
+                    self.consumer,
+                    self.lock_ttl_ms,
+                )
+            except Exception as e:
+                logger.warning(f"Не удалось продлить блокировку рассылки: {e}")
+                continue
+            if not renewed:
+                return
+
+    async def _send(self, tg_id: int, text: str) -> str:
+        async with self._semaphore:
+            await asyncio.sleep(self.bucket.reserve())
+            try:
+                await bot.send_message(tg_id, text)
+            except TelegramForbiddenError:
+                return BLOCKED
+            except Exception as e:
+                logger.warning(
+                    f"Не удалось отправить рассылку пользователю {tg_id}: {e}"
+                )
+                return FAILED
+            broadcast_messages_total.inc()
+            return SENT
+
+    async def _send_chunk(
+        self, redis, text: str, chunk: list[tuple[int, int]]
+    ) -> None:
+        """Отправить порцию и сохранить прогресс."""
+
+        results = await asyncio.gather(
+            *(self._send(tg_id, text) for _, tg_id in chunk)
+        )
+        blocked = [
+            tg_id
+            for (_, tg_id), result in zip(chunk, results)
+            if result == BLOCKED
+        ]
+        async with AsyncSessionLocal() as session:
+            await user_crud.set_blocked_bot(blocked, True, session)
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(BROADCAST_KEY, "last_id", chunk[-1][0])
+            for status in (SENT, BLOCKED, FAILED):
+                pipe.hincrby(BROADCAST_KEY, status, results.count(status))
+            await pipe.execute()
+
+    async def _notify_admin(self, progress: dict) -> None:
+        try:
+            await bot.send_message(
+                int(progress["admin_id"]), get_progress_text(progress)
+            )
+        except Exception as e:
+            logger.error(f"Не удалось отправить итог рассылки: {e}")
+
+    async def _broadcast(self, redis) -> None:
+        progress = await redis.hgetall(BROADCAST_KEY)
+        if progress.get("status") != RUNNING:
+            return
+        text = progress["text"]
+        last_id = int(progress.get("last_id", 0))
+        logger.info(f"Рассылка начата после пользователя с id {last_id}.")
+
+        while True:
+            async with AsyncSessionLocal() as session:
+                chunk = await user_crud.get_broadcast_recipients(
+                    last_id, self.chunk_size, session
+                )
+            if not chunk:
+                break
+            await self._send_chunk(redis, text, chunk)
+            last_id = chunk[-1][0]
+
+        await redis.hset(BROADCAST_KEY, "status", FINISHED)
+        progress = await redis.hgetall(BROADCAST_KEY)
+        logger.info(get_progress_text(progress))
+        await self._notify_admin(progress)
+
+    async def _broadcast_with_retries(self, redis) -> None:
+        """
+        Вести рассылку, после ошибки продолжая с сохранённого места.
+
+        После max_retries неудачных попыток подряд рассылка отмечается
+        прерванной, и администратор может запустить новую.
+        """
+
+        delay = self.retry_delay
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self._broadcast(redis)
+                return
+            except Exception as e:
+                logger.error(f"Ошибка рассылки, попытка {attempt}: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+        await redis.hset(BROADCAST_KEY, "status", ABORTED)
+        await self._notify_admin(await redis.hgetall(BROADCAST_KEY))
+
+    async def _run(self, is_locked: bool = False) -> None:
+        redis = get_redis_connection()
+        try:
+            if not is_locked and not await self._acquire_lock(redis):
+                return
+        except Exception as e:
+            logger.error(f"Не удалось взять блокировку рассылки: {e}")
+            return
+
+        work = asyncio.create_task(self._broadcast_with_retries(redis))
+        heartbeat = asyncio.create_task(self._keep_lock(redis))
+        try:
+            await asyncio.wait(
+                {work, heartbeat}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not work.done():
+                logger.error(
+                    "Блокировка рассылки потеряна, рассылка остановлена."
+                )
+            elif work.exception() is not None:
+                logger.error(f"Ошибка рассылки: {work.exception()}")
+        finally:
+            work.cancel()
+            heartbeat.cancel()
+            await asyncio.gather(work, heartbeat, return_exceptions=True)
+            try:
+                await self._release_lock(redis)
+            except Exception as e:
+                logger.error(f"Не удалось снять блокировку рассылки: {e}")
+
+
+broadcaster = Broadcaster(
+    rate=settings.broadcast_rate,
+    workers=settings.broadcast_workers,
+    chunk_size=settings.broadcast_chunk_size,
+)
@@ -28,12 +28,32 @@ from crud import (
     products_crud,
 )
 import bot.bot_const as bc
-from loggers.log import setup_logging
+from middlewares.middleware import callback_routing_index
 
 
 router = Router()
+callback_routing_index.register(
+    router,
+    exact=(
+        "show_projects",
+        "back_to_main_menu",
+        "get_faq",
+        "get_problems_with_products",
+        "back_to_previous_menu",
+        "view_portfolio",
+        "company_info",
+        "tech_support",
+        "products_services",
+        "get_feedback_no",
+    ),
+    prefixes=(
+        bc.CATEGORY_CALLBACK,
+        bc.ANSWER_CALLBACK,
+        bc.SHOW_CATEGORY_CALLBACK,
+        bc.BACK_CALLBACK,
+    ),
+)
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -112,7 +132,7 @@ async def get_questions(
 @message_exception_handler(
     log_error_text="Ошибка при получении ответа на вопрос."
 )
-@router.callback_query(F.data.startswith("answer:"))
+@router.callback_query(F.data.startswith(bc.ANSWER_CALLBACK))
 async def get_faq_answer(
     callback: CallbackQuery, session: AsyncSession
 ) -> None:
@@ -168,7 +188,7 @@ async def back_to_products(
 @message_exception_handler(
     log_error_text="Ошибка при запросе ответа для выбранной категории."
 )
-@router.callback_query(F.data.startswith("category_"))
+@router.callback_query(F.data.startswith(bc.CATEGORY_CALLBACK))
 async def get_response_by_title(
     callback: CallbackQuery, session: AsyncSession
 ) -> None:
@@ -178,7 +198,7 @@ async def get_response_by_title(
 
     user_id = get_user_id(callback)
 
-    product_id = int(callback.data.split("_")[1])
+    product_id = int(callback.data.split(":")[1])
     product = await products_crud.get(product_id, session)
 
     await callback.message.edit_text(
@@ -296,7 +316,7 @@ async def get_feedback_no(callback: CallbackQuery) -> None:
 @message_exception_handler(
     log_error_text="Ошибка при ответе на выбранный тип категории."
 )
-@router.callback_query(F.data.startswith("show_category"))
+@router.callback_query(F.data.startswith(bc.SHOW_CATEGORY_CALLBACK))
 async def process_category_callback(callback: CallbackQuery, session):
 
     await callback.answer()
@@ -322,7 +342,7 @@ async def process_category_callback(callback: CallbackQuery, session):
 
 
 @message_exception_handler(log_error_text="Ошибка при возврате назад.")
-@router.callback_query(F.data.startswith("back"))
+@router.callback_query(F.data.startswith(bc.BACK_CALLBACK))
 async def process_back_callback(callback: CallbackQuery):
 
     await callback.answer()
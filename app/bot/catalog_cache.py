@@ -0,0 +1,57 @@
+from typing import Awaitable, Callable, Hashable
+
+from aiogram.types import InlineKeyboardMarkup
+
+from redis_db.invalidation import invalidation_listener, publish_invalidation
+
+CATALOG_CHANNEL = "catalog_changed"
+
+
+class CatalogCache:
+    """
+    Кеш готовых клавиатур каталога.
+
+    Клавиатура строится запросом в БД только при первом обращении,
+    дальше отдаётся из памяти. Кеш целиком сбрасывается, когда
+    администратор изменяет данные каталога, в том числе на других
+    репликах бота через канал CATALOG_CHANNEL.
+    """
+
+    def __init__(self) -> None:
+        self._keyboards: dict[Hashable, InlineKeyboardMarkup] = {}
+        self._version = 0
+
+    async def get_or_build(
+        self,
+        key: Hashable,
+        build: Callable[[], Awaitable[InlineKeyboardMarkup]],
+    ) -> InlineKeyboardMarkup:
+        """Вернуть клавиатуру из кеша или построить и сохранить её."""
+
+        keyboard = self._keyboards.get(key)
+        if keyboard is None:
+            version = self._version
+            keyboard = await build()
+            # Клавиатура, построенная до сброса кеша, может быть устаревшей.
+            if version == self._version:
+                self._keyboards[key] = keyboard
+        return keyboard
+
+    def clear(self) -> None:
+        """Сбросить кеш в текущем процессе."""
+
+        self._keyboards.clear()
+        self._version += 1
+
+    async def invalidate(self) -> None:
+        """Сбросить кеш во всех репликах бота."""
+
+        self.clear()
+        await publish_invalidation(CATALOG_CHANNEL)
+
+    async def _on_invalidation(self, data: str | None) -> None:
+        self.clear()
+
+
+catalog_cache = CatalogCache()
+invalidation_listener.subscribe(CATALOG_CHANNEL, catalog_cache._on_invalidation)
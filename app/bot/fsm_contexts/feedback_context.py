@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
@@ -8,15 +9,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import bot.bot_const as bc
 from bot.exceptions import message_exception_handler
 from helpers import ask_next_question, get_user_id
-from loggers.log import setup_logging
 from bot.validators import is_valid_rating
+from core.db import run_after_commit
 from crud import user_crud, feedback_crud
 from bot.keyborads import get_back_to_main_keyboard
+from middlewares.middleware import callback_routing_index
 
 
 router = Router()
+callback_routing_index.register(router, exact=("get_feedback_yes",))
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -79,10 +81,14 @@ async def process_description(
 
     logger.info(f'Запись создана в БД с ID: {feedback_data.get("user")}.')
 
-    await message.answer(
-        f"Спасибо за вашу оценку: {feedback_data['rating']}\n"
-        f"Ваш комментарий: {feedback_data['feedback_text']}",
-        reply_markup=await get_back_to_main_keyboard(),
+    await run_after_commit(
+        session,
+        partial(
+            message.answer,
+            f"Спасибо за вашу оценку: {feedback_data['rating']}\n"
+            f"Ваш комментарий: {feedback_data['feedback_text']}",
+            reply_markup=await get_back_to_main_keyboard(),
+        ),
     )
 
     await state.clear()
@@ -1,5 +1,5 @@
 import logging
-import asyncio
+from functools import partial
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
@@ -10,23 +10,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import bot.bot_const as bc
 from bot.exceptions import message_exception_handler
 from bot.keyborads import back_to_main_menu
-from bot.smtp import send_mail
+from bot.manager_notifications import manager_notifier
+from bot.smtp import enqueue_mail
 from bot.validators import (
     is_valid_name,
     is_valid_phone_number,
     format_phone_number
 )
+from core.db import run_after_commit
 from crud.request_to_manager import create_request_to_manager
 from helpers import ask_next_question, get_user_id, start_inactivity_timer
-from loggers.log import setup_logging
 from core.bot_setup import bot
 from core.settings import settings
+from middlewares.middleware import callback_routing_index
 
 
 router = Router()
+callback_routing_index.register(
+    router, exact=("contact_manager", "callback_request")
+)
 
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -109,19 +113,37 @@ async def process_phone_number(
 
     logger.info(f"Запись создана в БД с ID: {new_request.id}.")
 
-    mail = send_mail("Заявка на обратную связь", settings.email, user_data)
-    asyncio.gather(asyncio.create_task(mail))
+    await run_after_commit(
+        session,
+        partial(
+            enqueue_mail,
+            "Заявка на обратную связь",
+            settings.email,
+            user_data,
+            request_type,
+        ),
+    )
+    await run_after_commit(
+        session,
+        partial(
+            manager_notifier.notify, new_request.id, user_data, request_type
+        ),
+    )
 
     logger.info(
-        "Отправлено сообщение на почту менеджеру для связи "
-        f"с пользователем {user_id}"
+        "Письмо менеджеру для связи с пользователем "
+        f"{user_id} поставлено в очередь."
     )
 
-    await message.answer(
-        bc.succses_answer(user_data),
-        reply_markup=InlineKeyboardBuilder().add(
-            back_to_main_menu
-        ).as_markup(),
+    await run_after_commit(
+        session,
+        partial(
+            message.answer,
+            bc.succses_answer(user_data),
+            reply_markup=InlineKeyboardBuilder().add(
+                back_to_main_menu
+            ).as_markup(),
+        ),
     )
 
     await start_inactivity_timer(message, user_id, bot)
@@ -1,9 +1,15 @@
 import logging
 
 from aiogram import Router, F
-from aiogram.filters import CommandStart, Command
+from aiogram.filters import (
+    KICKED,
+    MEMBER,
+    ChatMemberUpdatedFilter,
+    CommandStart,
+    Command,
+)
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message
+from aiogram.types import ChatMemberUpdated, Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin.keyboards.keyboards import get_inline_keyboard
@@ -20,13 +26,11 @@ from bot.exceptions import message_exception_handler
 from helpers import get_user_id, start_inactivity_timer
 from core.bot_setup import bot
 from bot.bot_const import MESSAGE_FOR_NOT_SUPPORTED_CONTENT_TYPE
-from loggers.log import setup_logging
 
 
 router = Router()
 
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +42,7 @@ async def cmd_admin(message: Message, session: AsyncSession) -> None:
     """Вход в админку."""
 
     user_id = get_user_id(message)
-    role = await user_crud.get_role_by_tg_id(user_id, session)
+    role = await user_crud.get_cached_role_by_tg_id(user_id, session)
 
     if role in (RoleEnum.ADMIN, RoleEnum.MANAGER):
         await message.answer(
@@ -64,8 +68,7 @@ async def cmd_start(
 
     user_id = get_user_id(message)
 
-    if not await user_crud.get_user_by_tg_id(user_id, session):
-        await user_crud.create({"tg_id": user_id}, session)
+    await user_crud.ensure_user(user_id, session)
 
     await message.answer(START_MESSAGE, reply_markup=main_keyboard)
 
@@ -74,6 +77,32 @@ async def cmd_start(
     await start_inactivity_timer(message, user_id, bot)
 
 
+@router.my_chat_member(
+    F.chat.type == "private",
+    ChatMemberUpdatedFilter(member_status_changed=MEMBER >> KICKED),
+)
+async def user_blocked_bot(
+    event: ChatMemberUpdated, session: AsyncSession
+) -> None:
+    """Отметить пользователя, заблокировавшего бота."""
+
+    await user_crud.set_blocked_bot([event.from_user.id], True, session)
+    logger.info(f"Пользователь {event.from_user.id} заблокировал бота.")
+
+
+@router.my_chat_member(
+    F.chat.type == "private",
+    ChatMemberUpdatedFilter(member_status_changed=KICKED >> MEMBER),
+)
+async def user_unblocked_bot(
+    event: ChatMemberUpdated, session: AsyncSession
+) -> None:
+    """Вернуть пользователя в рассылки после разблокировки бота."""
+
+    await user_crud.set_blocked_bot([event.from_user.id], False, session)
+    logger.info(f"Пользователь {event.from_user.id} разблокировал бота.")
+
+
 @router.message(F.content_type)
 async def handle_any_content(message: Message):
     """Ответ на любой другой тип контента."""
@@ -0,0 +1,113 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class InactivityScheduler:
+    """
+    Планировщик таймеров бездействия пользователей.
+
+    Сроки всех пользователей лежат в одной куче и обслуживаются
+    одной фоновой задачей. Перенос таймера стоит O(log n): старая запись
+    остаётся в куче и пропускается при извлечении, так как срок
+    пользователя в словаре уже другой.
+    """
+
+    def __init__(self, on_expire: Callable[[int], Awaitable[None]]) -> None:
+        self.on_expire = on_expire
+        self._deadlines: dict[int, float] = {}
+        self._heap: list[tuple[float, int]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._callbacks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Количество запущенных таймеров."""
+
+        return len(self._deadlines)
+
+    async def schedule(self, user_id: int, timeout: float) -> None:
+        """Запустить или перезапустить таймер пользователя."""
+
+        deadline = time.monotonic() + timeout
+        self._deadlines[user_id] = deadline
+        heapq.heappush(self._heap, (deadline, user_id))
+
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._compact()
+
+        if self._heap[0] == (deadline, user_id):
+            self._wakeup.set()
+
+    async def cancel(self, user_id: int) -> None:
+        """Отменить таймер пользователя."""
+
+        self._deadlines.pop(user_id, None)
+
+    def start(self) -> None:
+        """Запустить фоновую задачу планировщика."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить фоновую задачу планировщика."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _compact(self) -> None:
+        """Убрать из кучи записи перенесённых и отменённых таймеров."""
+
+        self._heap = [
+            (deadline, user_id)
+            for user_id, deadline in self._deadlines.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _pop_expired(self) -> list[int]:
+        now = time.monotonic()
+        expired = []
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, user_id = heapq.heappop(self._heap)
+            if self._deadlines.get(user_id) == deadline:
+                del self._deadlines[user_id]
+                expired.append(user_id)
+
+        return expired
+
+    async def _expire(self, user_id: int) -> None:
+        try:
+            await self.on_expire(user_id)
+        except Exception as e:
+            logger.error(
+                f"Ошибка обработки таймера пользователя {user_id}: {e}"
+            )
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            for user_id in self._pop_expired():
+                task = asyncio.create_task(self._expire(user_id))
+                self._callbacks.add(task)
+                task.add_done_callback(self._callbacks.discard)
+
+            delay = (
+                self._heap[0][0] - time.monotonic() if self._heap else None
+            )
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
@@ -2,6 +2,8 @@ from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import bot.bot_const as bc
+from bot.catalog_cache import catalog_cache
 from crud import (
     company_info_crud,
     category_product_crud,
@@ -58,6 +60,12 @@ async def get_back_to_main_keyboard():
 
 async def get_company_information_keyboard(session: AsyncSession):
     """Инлайн клавиатура для информации о компании."""
+    return await catalog_cache.get_or_build(
+        "company_info", lambda: _build_company_information_keyboard(session)
+    )
+
+
+async def _build_company_information_keyboard(session: AsyncSession):
     builder = InlineKeyboardBuilder()
 
     about_company = await company_info_crud.get_multi(session)
@@ -71,7 +79,12 @@ async def get_company_information_keyboard(session: AsyncSession):
 
 async def inline_products_and_services(session: AsyncSession):
     """Инлайн клавиатура для продуктов и услуг."""
+    return await catalog_cache.get_or_build(
+        "products", lambda: _build_products_and_services(session)
+    )
 
+
+async def _build_products_and_services(session: AsyncSession):
     keyboard = InlineKeyboardBuilder()
 
     objects_in_db = await products_crud.get_multi(session)
@@ -79,7 +92,8 @@ async def inline_products_and_services(session: AsyncSession):
     for obj in objects_in_db:
         keyboard.add(
             InlineKeyboardButton(
-                text=obj.name, callback_data=f"category_{obj.id}"
+                text=obj.name,
+                callback_data=f"{bc.CATEGORY_CALLBACK}{obj.id}",
             )
         )
 
@@ -105,7 +119,12 @@ async def get_company_portfolio_choice(url: str):
 
 async def list_of_projects_keyboard(session: AsyncSession):
     """Инлайн вывод проектов с данными из БД."""
+    return await catalog_cache.get_or_build(
+        "projects", lambda: _build_list_of_projects(session)
+    )
 
+
+async def _build_list_of_projects(session: AsyncSession):
     projects = await portfolio_crud.get_multi(session)
 
     keyboard = InlineKeyboardBuilder()
@@ -142,7 +161,15 @@ async def faq_or_problems_with_products_inline_keyboard(
     question_type: str, session: AsyncSession
 ) -> InlineKeyboardMarkup:
     """Инлайн-клавиатуры для f.a.q вопросов или проблем с продуктами."""
+    return await catalog_cache.get_or_build(
+        ("questions", question_type),
+        lambda: _build_questions_keyboard(question_type, session),
+    )
 
+
+async def _build_questions_keyboard(
+    question_type: str, session: AsyncSession
+) -> InlineKeyboardMarkup:
     questions = await info_crud.get_all_questions_by_type(
         question_type, session
     )
@@ -151,7 +178,8 @@ async def faq_or_problems_with_products_inline_keyboard(
     for question in questions:
         keyboard.add(
             InlineKeyboardButton(
-                text=question.question, callback_data=f"answer:{question.id}"
+                text=question.question,
+                callback_data=f"{bc.ANSWER_CALLBACK}{question.id}",
             )
         )
 
@@ -164,7 +192,15 @@ async def category_type_inline_keyboard(
     product_id: str, session: AsyncSession
 ) -> InlineKeyboardMarkup:
     """Инлайн клавиатура для типов в категориях."""
+    return await catalog_cache.get_or_build(
+        ("categories", int(product_id)),
+        lambda: _build_category_type_keyboard(product_id, session),
+    )
 
+
+async def _build_category_type_keyboard(
+    product_id: str, session: AsyncSession
+) -> InlineKeyboardMarkup:
     category_types = await category_product_crud.get_category_by_product_id(
         product_id, session
     )
@@ -176,7 +212,7 @@ async def category_type_inline_keyboard(
             InlineKeyboardButton(
                 text=category_type.name,
                 url=category_type.url,
-                callback_data=f"show_category:{category_type.id}",
+                callback_data=f"{bc.SHOW_CATEGORY_CALLBACK}{category_type.id}",
             )
         )
 
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import time
+
+from aiogram.exceptions import TelegramForbiddenError
+
+from bot.bot_const import REQUEST_TYPE_TITLES
+from core.bot_setup import bot
+from core.db import AsyncSessionLocal
+from core.metrics import Gauge
+from core.settings import settings
+from crud.user_crud import ROLE_CHANNEL, user_crud
+from redis_db.invalidation import invalidation_listener
+
+logger = logging.getLogger(__name__)
+
+# Сколько заявок перечислять в одном сообщении, чтобы не превысить
+# ограничение Telegram на длину текста.
+MAX_REQUESTS_IN_MESSAGE = 20
+
+
+def get_request_text(
+    request_id: int, user_data: dict, request_type: str
+) -> str:
+    """Строка о заявке в уведомлении менеджеру."""
+
+    title = REQUEST_TYPE_TITLES.get(request_type, "Заявка")
+    return (
+        f"№{request_id} {title}: {user_data['first_name']}, "
+        f"{user_data['phone_number']}"
+    )
+
+
+def get_notification_text(requests: list[str]) -> str:
+    """Текст уведомления о накопившихся заявках."""
+
+    if len(requests) == 1:
+        return f"Новая заявка!\n\n{requests[0]}"
+    lines = "\n".join(requests[:MAX_REQUESTS_IN_MESSAGE])
+    text = f"Новые заявки: {len(requests)}\n\n{lines}"
+    if len(requests) > MAX_REQUESTS_IN_MESSAGE:
+        text += f"\n...и ещё {len(requests) - MAX_REQUESTS_IN_MESSAGE}"
+    return text
+
+
+class ManagerNotifier:
+    """
+    Уведомления менеджеров и администраторов о новых заявках в Telegram.
+
+    Заявки складываются в очередь процесса. Фоновая задача забирает
+    всё накопившееся и отправляет каждому получателю одно сообщение,
+    поэтому в один чат уходит не больше сообщения за chat_interval
+    секунд, а общий темп рассылки ограничен rate сообщениями в секунду.
+    Список получателей кешируется на recipients_ttl секунд и
+    сбрасывается при смене роли любого пользователя.
+    """
+
+    def __init__(
+        self,
+        rate: float = 25,
+        chat_interval: float = 1,
+        recipients_ttl: float = 300,
+    ) -> None:
+        self.send_interval = 1 / rate
+        self.chat_interval = chat_interval
+        self.recipients_ttl = recipients_ttl
+        self._recipients: list[int] | None = None
+        self._recipients_expire_at = 0.0
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Число заявок, ожидающих отправки."""
+
+        return self._queue.qsize()
+
+    async def notify(
+        self, request_id: int, user_data: dict, request_type: str
+    ) -> None:
+        """Поставить уведомление о заявке в очередь."""
+
+        self._queue.put_nowait(
+            get_request_text(request_id, user_data, request_type)
+        )
+
+    async def get_recipients(self) -> list[int]:
+        """tg_id менеджеров и администраторов, по возможности из кеша."""
+
+        if (
+            self._recipients is None
+            or time.monotonic() >= self._recipients_expire_at
+        ):
+            async with AsyncSessionLocal() as session:
+                users = await user_crud.get_manager_and_admin_list(session)
+            self._recipients = [user.tg_id for user in users]
+            self._recipients_expire_at = (
+                time.monotonic() + self.recipients_ttl
+            )
+        return self._recipients
+
+    async def _on_role_changed(self, data: str | None) -> None:
+        self._recipients = None
+
+    def start(self) -> None:
+        """Запустить фоновую рассылку уведомлений."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить рассылку уведомлений."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _send(self, chat_id: int, text: str) -> None:
+        try:
+            await bot.send_message(chat_id, text)
+        except TelegramForbiddenError:
+            logger.warning(
+                f"Менеджер {chat_id} заблокировал бота, "
+                "уведомление не доставлено."
+            )
+
+    async def _fan_out(self, requests: list[str]) -> None:
+        text = get_notification_text(requests)
+        for chat_id in await self.get_recipients():
+            try:
+                await self._send(chat_id, text)
+            except Exception as e:
+                logger.error(
+                    f"Не удалось уведомить менеджера {chat_id}: {e}"
+                )
+            await asyncio.sleep(self.send_interval)
+
+    async def _run(self) -> None:
+        while True:
+            requests = [await self._queue.get()]
+            while not self._queue.empty():
+                requests.append(self._queue.get_nowait())
+            started_at = time.monotonic()
+            try:
+                await self._fan_out(requests)
+            except Exception as e:
+                logger.error(f"Ошибка рассылки уведомлений о заявках: {e}")
+            # Следующее сообщение в тот же чат не раньше chat_interval.
+            await asyncio.sleep(
+                max(0, self.chat_interval - (time.monotonic() - started_at))
+            )
+
+
+manager_notifier = ManagerNotifier(
+    rate=settings.manager_notify_rate,
+    recipients_ttl=settings.manager_recipients_ttl,
+)
+invalidation_listener.subscribe(
+    ROLE_CHANNEL, manager_notifier._on_role_changed
+)
+
+Gauge(
+    "manager_notifications_pending",
+    "Число заявок, ожидающих уведомления менеджеров в Telegram.",
+    func=lambda: manager_notifier.pending,
+)
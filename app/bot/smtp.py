@@ -1,16 +1,62 @@
+import asyncio
+import logging
+import os
+import socket
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from aiosmtplib import SMTP
 
+from aiosmtplib import SMTP, SMTPServerDisconnected
+from redis.exceptions import ResponseError
+
+from bot.bot_const import REQUEST_TYPE_TITLES
+from core.metrics import Counter, Gauge
 from core.settings import settings
+from redis_db.connect import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+MAIL_STREAM = "mail:outbox"
+MAIL_GROUP = "mail_workers"
+# Письма, которые не удалось отправить после всех попыток.
+MAIL_DEAD_LETTER_STREAM = "mail:dead"
+
+mail_outbox_depth = Gauge(
+    "mail_outbox_depth",
+    "Число писем в очереди на отправку.",
+)
+mail_sent_total = Counter(
+    "mail_sent_total",
+    "Сколько писем отправлено.",
+)
+mail_failed_total = Counter(
+    "mail_failed_total",
+    "Сколько писем ушло в mail:dead после всех попыток.",
+)
 
 
-async def send_mail(subject, to, user_data):
-    text = (
+def get_mail_text(user_data: dict) -> str:
+    """Текст письма о заявке пользователя."""
+
+    return (
         f'Пользователь {user_data["first_name"]} '
         f'заказал звонок по номеру {user_data["phone_number"]}'
     )
 
+
+def get_digest_text(batch: list[dict]) -> str:
+    """Текст сводного письма о нескольких заявках одного типа."""
+
+    title = REQUEST_TYPE_TITLES.get(
+        batch[0].get("request_type"), "Заявки"
+    )
+    lines = "<br>".join(get_mail_text(fields) for fields in batch)
+    return f"{title}, новых заявок: {len(batch)}<br><br>{lines}"
+
+
+def build_message(subject: str, to: str, text: str) -> MIMEMultipart:
+    """Собрать HTML-письмо."""
+
     message = MIMEMultipart()
     message["From"] = settings.email
     message["To"] = to
@@ -18,8 +64,304 @@ async def send_mail(subject, to, user_data):
     message.attach(
         MIMEText(f"<html><body>{text}</body></html>", "html", "utf-8")
     )
+    return message
+
+
+async def enqueue_mail(
+    subject: str, to: str, user_data: dict, request_type: str
+) -> None:
+    """
+    Поставить письмо в очередь на отправку.
+
+    Письмо отправит фоновый MailOutboxWorker. Ошибка Redis не должна
+    ломать обработку заявки, поэтому она только логируется.
+    """
+
+    try:
+        await get_redis_connection().xadd(
+            MAIL_STREAM,
+            {
+                "subject": subject,
+                "to": to,
+                "first_name": user_data["first_name"],
+                "phone_number": user_data["phone_number"],
+                "request_type": request_type,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Не удалось поставить письмо в очередь: {e}")
+
+
+class SmtpSession:
+    """
+    Одно авторизованное соединение SMTP на процесс.
+
+    Соединение открывается при первом письме и переиспользуется,
+    чтобы не делать TLS-рукопожатие и login на каждое письмо.
+    """
+
+    def __init__(self) -> None:
+        self._client: SMTP | None = None
+        self.last_used = 0.0
+
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None and self._client.is_connected
+
+    async def _connect(self) -> None:
+        await self.close()
+        client = SMTP(
+            hostname=settings.smtp_hostname,
+            port=settings.smtp_port,
+            use_tls=True,
+            timeout=settings.smtp_timeout,
+        )
+        await client.connect()
+        await client.login(settings.email, settings.email_password)
+        self._client = client
+
+    async def send(self, message: MIMEMultipart) -> None:
+        """Отправить письмо, при необходимости переподключившись."""
+
+        if not self.is_connected:
+            await self._connect()
+        try:
+            await self._client.send_message(message)
+        except SMTPServerDisconnected:
+            # Сервер закрыл простаивающее соединение.
+            await self._connect()
+            await self._client.send_message(message)
+        self.last_used = time.monotonic()
+
+    async def close(self) -> None:
+        """Закрыть соединение, если оно открыто."""
+
+        client, self._client = self._client, None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+
+class MailOutboxWorker:
+    """
+    Фоновая отправка писем из потока Redis.
+
+    Письма читаются через группу потребителей, поэтому при нескольких
+    репликах каждое письмо отправляется один раз. Запись удаляется из
+    потока только после отправки; письма, зависшие у упавшего процесса,
+    забираются через XAUTOCLAIM. Неудачная отправка откладывает только
+    свою группу писем с экспоненциальной задержкой, не останавливая
+    остальные, а после max_retries попыток письма переносятся
+    в поток mail:dead.
+
+    Заявки группируются по адресату и типу заявки. Первая заявка
+    уходит сразу, а пришедшие в течение digest_window секунд после
+    неё собираются в одно сводное письмо.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 10,
+        block_ms: int = 1000,
+        max_retries: int = 5,
+        retry_delay: float = 1,
+        retry_max_delay: float = 60,
+        idle_timeout: float = 60,
+        digest_window: float = 60,
+    ) -> None:
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.idle_timeout = idle_timeout
+        self.digest_window = digest_window
+        # Письма, отложенные до конца окна или до следующей попытки,
+        # остаются неподтверждёнными, поэтому чужой XAUTOCLAIM не должен
+        # забрать их раньше времени.
+        self.claim_idle_ms = int(
+            max(60, digest_window * 2, retry_max_delay * 2) * 1000
+        )
+        self._batches: dict[tuple, dict[str, dict]] = {}
+        self._last_sent: dict[tuple, float] = {}
+        self._attempts: dict[tuple, int] = {}
+        self._retry_at: dict[tuple, float] = {}
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.smtp = SmtpSession()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Запустить фоновую отправку писем."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить отправку и закрыть соединение SMTP."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.smtp.close()
+
+    async def _ensure_group(self, redis) -> None:
+        try:
+            await redis.xgroup_create(
+                MAIL_STREAM, MAIL_GROUP, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _fetch(self, redis) -> list[tuple[str, dict]]:
+        """Забрать зависшие письма, а если их нет, дождаться новых."""
+
+        claimed = await redis.xautoclaim(
+            MAIL_STREAM,
+            MAIL_GROUP,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            count=self.batch_size,
+        )
+        entries = [entry for entry in claimed[1] if entry[1]]
+        if entries:
+            return entries
+
+        response = await redis.xreadgroup(
+            MAIL_GROUP,
+            self.consumer,
+            {MAIL_STREAM: ">"},
+            count=self.batch_size,
+            block=self.block_ms,
+        )
+        return response[0][1] if response else []
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """Задержка перед попыткой attempt + 1."""
+
+        return min(
+            self.retry_delay * 2 ** (attempt - 1), self.retry_max_delay
+        )
+
+    async def _send(self, batch: dict[str, dict]) -> bool:
+        """Отправить группу писем одним письмом."""
+
+        entries = list(batch.values())
+        first = entries[0]
+        if len(entries) == 1:
+            text = get_mail_text(first)
+        else:
+            text = get_digest_text(entries)
+        try:
+            await self.smtp.send(
+                build_message(first["subject"], first["to"], text)
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось отправить письмо {first['to']}: {e}")
+            await self.smtp.close()
+            return False
+        mail_sent_total.inc()
+        return True
+
+    async def _remove(
+        self, redis, batch: dict[str, dict], dead_letter: bool = False
+    ) -> None:
+        """Подтвердить и удалить записи, при необходимости в mail:dead."""
+
+        async with redis.pipeline(transaction=True) as pipe:
+            if dead_letter:
+                for fields in batch.values():
+                    pipe.xadd(MAIL_DEAD_LETTER_STREAM, fields)
+            pipe.xack(MAIL_STREAM, MAIL_GROUP, *batch)
+            pipe.xdel(MAIL_STREAM, *batch)
+            await pipe.execute()
+
+    def _forget(self, key: tuple) -> None:
+        del self._batches[key]
+        self._attempts.pop(key, None)
+        self._retry_at.pop(key, None)
+
+    async def _flush_due(self, redis) -> None:
+        """
+        Отправить группы, для которых закончилось окно сводки
+        и наступило время очередной попытки.
+        """
+
+        now = time.monotonic()
+        for key, batch in list(self._batches.items()):
+            if now < self._retry_at.get(key, 0):
+                continue
+            last_sent = self._last_sent.get(key)
+            if last_sent is not None and now - last_sent < self.digest_window:
+                continue
+
+            if await self._send(batch):
+                await self._remove(redis, batch)
+                self._last_sent[key] = time.monotonic()
+                self._forget(key)
+                continue
+
+            attempt = self._attempts.get(key, 0) + 1
+            if attempt >= self.max_retries:
+                logger.error(
+                    f"Письма {list(batch)} не отправлены после "
+                    f"{attempt} попыток и перенесены в "
+                    f"{MAIL_DEAD_LETTER_STREAM}."
+                )
+                mail_failed_total.inc(len(batch))
+                await self._remove(redis, batch, dead_letter=True)
+                self._forget(key)
+                continue
+            self._attempts[key] = attempt
+            self._retry_at[key] = time.monotonic() + self.get_retry_delay(
+                attempt
+            )
+
+    async def _collect(self, redis) -> list[tuple[str, dict]]:
+        """Забрать новые письма и разложить их по группам."""
+
+        entries = await self._fetch(redis)
+        for entry_id, fields in entries:
+            key = (fields["to"], fields["subject"], fields.get("request_type"))
+            self._batches.setdefault(key, {})[entry_id] = fields
+        return entries
+
+    async def _drain(self) -> None:
+        redis = get_redis_connection()
+        await self._ensure_group(redis)
+        while True:
+            entries = await self._collect(redis)
+            await self._flush_due(redis)
+            mail_outbox_depth.set(await redis.xlen(MAIL_STREAM))
+            if (
+                not entries
+                and self.smtp.is_connected
+                and time.monotonic() - self.smtp.last_used > self.idle_timeout
+            ):
+                await self.smtp.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка обработки очереди писем: {e}")
+                await asyncio.sleep(self.retry_delay)
+
 
-    smtp_client = SMTP(hostname="smtp.yandex.ru", port=465, use_tls=True)
-    async with smtp_client:
-        await smtp_client.login(settings.email, settings.email_password)
-        await smtp_client.send_message(message)
+mail_outbox_worker = MailOutboxWorker(
+    max_retries=settings.mail_max_retries,
+    retry_delay=settings.mail_retry_delay,
+    retry_max_delay=settings.mail_retry_max_delay,
+    idle_timeout=settings.smtp_idle_timeout,
+    digest_window=settings.mail_digest_window,
+)
@@ -1,13 +1,22 @@
 import logging
 from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
 
 from .settings import settings
+from middlewares.middleware import OutgoingRateLimiter
+from redis_db.fsm_storage import get_fsm_storage
 
 logger = logging.getLogger(__name__)
 
 bot = Bot(token=settings.bot_token)
-dispatcher = Dispatcher(storage=MemoryStorage())
+bot.session.middleware(
+    OutgoingRateLimiter(
+        rate=settings.bot_rate_limit,
+        chat_rate=settings.bot_chat_rate_limit,
+        chat_burst=settings.bot_chat_burst,
+        max_retries=settings.bot_max_retries,
+    )
+)
+dispatcher = Dispatcher(storage=get_fsm_storage())
 
 
 def check_token() -> None:
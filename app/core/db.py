@@ -1,11 +1,16 @@
-from sqlalchemy import Integer
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import Integer, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession, create_async_engine, async_sessionmaker
 )
 from sqlalchemy.orm import (
     declarative_base, declared_attr, Mapped, mapped_column
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from .metrics import Counter, Gauge, Histogram
 from .settings import settings
 
 
@@ -19,6 +24,103 @@ class PreBase:
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
 
+# Ключи session.info для режима единицы работы: транзакцией владеет
+# middleware DataBaseSession, а CRUD только отправляет изменения в БД.
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT = "after_commit"
+
+
+async def save_changes(session: AsyncSession) -> None:
+    """Зафиксировать изменения или, внутри единицы работы, сделать flush."""
+
+    if session.info.get(UNIT_OF_WORK):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def run_after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Выполнить callback после фиксации транзакции.
+
+    Нужен для сброса кешей: другие обработчики не должны перечитать
+    данные из БД раньше, чем изменения станут видны.
+    """
+
+    if session.info.get(UNIT_OF_WORK):
+        session.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        await callback()
+
+
+db_pool_checkout_seconds = Histogram(
+    "db_pool_checkout_seconds",
+    "Время ожидания соединения из пула БД в секундах.",
+)
+db_pool_overflow_connections_total = Counter(
+    "db_pool_overflow_connections_total",
+    "Сколько раз пул БД открывал соединение сверх pool_size.",
+)
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, который замеряет время выдачи соединения."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - start)
+
+
+def get_connect_args() -> dict:
+    """Параметры подключения asyncpg: кеш prepared statements и таймаут."""
+
+    if "asyncpg" not in settings.database_url:
+        return {}
+    return {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "server_settings": {
+            "statement_timeout": str(settings.db_statement_timeout),
+        },
+    }
+
+
 Base = declarative_base(cls=PreBase)
-engine = create_async_engine(settings.database_url)
-AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession)
+engine = create_async_engine(
+    settings.database_url,
+    poolclass=MeasuredQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args=get_connect_args(),
+)
+# Объекты, возвращённые INSERT/UPDATE ... RETURNING, остаются
+# доступными после commit без повторного SELECT.
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
+Gauge(
+    "db_pool_checked_out",
+    "Число соединений БД, выданных из пула.",
+    func=lambda: engine.pool.checkedout(),
+)
+Gauge(
+    "db_pool_overflow",
+    "Число открытых соединений БД сверх pool_size.",
+    func=lambda: max(engine.pool.overflow(), 0),
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def count_overflow_connection(dbapi_connection, connection_record):
+    """Учесть соединение, открытое сверх pool_size."""
+
+    if engine.pool.overflow() > 0:
+        db_pool_overflow_connections_total.inc()
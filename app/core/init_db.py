@@ -21,9 +21,5 @@ async def set_admin():
     """Добавить все TELEGRAM_IDS в администраторы."""
 
     async with AsyncSessionLocal() as session:
-        for admin in admin_list:
-            if not await user_crud.get_user_by_tg_id(admin, session):
-                await user_crud.create(
-                    {"tg_id": int(admin), "role": RoleEnum.ADMIN}, session
-                )
+        await user_crud.ensure_users(admin_list, session, role=RoleEnum.ADMIN)
             
\ No newline at end of file
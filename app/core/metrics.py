@@ -0,0 +1,127 @@
+"""Метрики процесса бота в текстовом формате Prometheus."""
+
+import bisect
+from abc import ABC, abstractmethod
+from typing import Callable, Sequence
+
+metrics_registry: list["Metric"] = []
+
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+
+class Metric(ABC):
+    """Базовый класс метрики: имя, описание и регистрация в реестре."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        metrics_registry.append(self)
+
+    @abstractmethod
+    def samples(self) -> list[tuple[str, float]]:
+        """Пары (имя, значение) для вывода метрики."""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(f"{name} {value}" for name, value in self.samples())
+        return "\n".join(lines)
+
+
+class Gauge(Metric):
+    """
+    Метрика, значение которой может как расти, так и уменьшаться.
+
+    Если передана функция func, значение вычисляется
+    в момент чтения метрики.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__(name, documentation)
+        self.func = func
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self.func() if self.func else self._value
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._value -= amount
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [(self.name, self.value)]
+
+
+class Counter(Metric):
+    """Метрика, значение которой только растёт."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [(self.name, self.value)]
+
+
+class Histogram(Metric):
+    """Распределение наблюдаемых значений по корзинам."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation)
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> list[tuple[str, float]]:
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self._counts):
+            cumulative += count
+            samples.append((f'{self.name}_bucket{{le="{bound}"}}', cumulative))
+        samples.append((f'{self.name}_bucket{{le="+Inf"}}', self.count))
+        samples.append((f"{self.name}_sum", self.sum))
+        samples.append((f"{self.name}_count", self.count))
+        return samples
+
+
+def render_metrics() -> str:
+    """Все зарегистрированные метрики одним текстом."""
+
+    return "\n".join(metric.render() for metric in metrics_registry) + "\n"
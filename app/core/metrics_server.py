@@ -0,0 +1,57 @@
+import logging
+
+from aiohttp import web
+
+from .metrics import render_metrics
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def metrics_handler(request: web.Request) -> web.Response:
+    """Отдать метрики процесса в формате Prometheus."""
+
+    return web.Response(text=render_metrics())
+
+
+def create_metrics_app() -> web.Application:
+    """Создать aiohttp-приложение с единственным маршрутом /metrics."""
+
+    app = web.Application()
+    app.router.add_get("/metrics", metrics_handler)
+    return app
+
+
+class MetricsServer:
+    """
+    Отдельный HTTP-сервер для метрик.
+
+    Работает и при long polling, и в режиме webhook, не открывая
+    метрики на внешнем адресе бота.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """Запустить сервер метрик."""
+
+        if self._runner is not None:
+            return
+        runner = web.AppRunner(create_metrics_app())
+        await runner.setup()
+        await web.TCPSite(runner, host=self.host, port=self.port).start()
+        self._runner = runner
+        logger.info(f"Метрики доступны на {self.host}:{self.port}/metrics.")
+
+    async def stop(self) -> None:
+        """Остановить сервер метрик."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+metrics_server = MetricsServer(settings.metrics_host, settings.metrics_port)
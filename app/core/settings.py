@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -19,6 +21,86 @@ class Settings(BaseSettings):
     db_host: str
     db_port: str
 
+    # Пул соединений с БД.
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # Таймаут запроса в миллисекундах и размер кеша prepared statements
+    # asyncpg (0 отключает кеш, нужно при работе через pgbouncer).
+    db_statement_timeout: int = 30000
+    db_statement_cache_size: int = 100
+
+    # Режим получения обновлений: long polling или webhook.
+    use_webhook: bool = False
+    webhook_base_url: str | None = None
+    webhook_path: str = "/webhook"
+    webhook_secret: str | None = None
+    webapp_host: str = "0.0.0.0"
+    webapp_port: int = 8000
+
+    # Адрес и порт HTTP-сервера метрик, работает в обоих режимах.
+    metrics_host: str = "0.0.0.0"
+    metrics_port: int = 8001
+
+    redis_url: str = "redis://localhost:6379"
+    redis_unix_socket_path: str | None = None
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 5
+    redis_socket_timeout: float = 5
+    redis_socket_connect_timeout: float = 5
+    redis_health_check_interval: float = 30
+    # Время жизни состояний и данных FSM в Redis, в секундах.
+    fsm_state_ttl: int = 86400
+    fsm_data_ttl: int = 86400
+
+    # Где хранить таймеры бездействия: "redis" или "memory".
+    inactivity_timers_storage: Literal["memory", "redis"] = "redis"
+
+    # Время жизни кеша ролей пользователей в секундах.
+    role_cache_ttl: int = 300
+
+    # Отправка писем: SMTP-сервер и повторы из очереди писем в Redis.
+    smtp_hostname: str = "smtp.yandex.ru"
+    smtp_port: int = 465
+    smtp_timeout: float = 30
+    # Через сколько секунд простоя закрыть соединение SMTP.
+    smtp_idle_timeout: float = 60
+    mail_max_retries: int = 5
+    mail_retry_delay: float = 1
+    mail_retry_max_delay: float = 60
+    # Окно сводки: заявки одного типа, пришедшие в течение этого
+    # времени после отправленного письма, уходят одним письмом.
+    mail_digest_window: float = 60
+
+    # Ограничение исходящих запросов к Bot API: общий темп и темп
+    # на один чат в запросах в секунду, всплеск на чат и число
+    # повторов после ответа 429.
+    bot_rate_limit: float = 30
+    bot_chat_rate_limit: float = 1
+    bot_chat_burst: int = 3
+    bot_max_retries: int = 3
+
+    # Уведомления менеджеров о новых заявках в Telegram: темп рассылки
+    # в сообщениях в секунду и время жизни кеша списка получателей.
+    manager_notify_rate: float = 25
+    manager_recipients_ttl: int = 300
+
+    # Рассылка всем пользователям: темп в сообщениях в секунду, число
+    # параллельных отправок и размер порции, которая читается из БД
+    # одним запросом и после которой сохраняется прогресс.
+    broadcast_rate: float = 20
+    broadcast_workers: int = 5
+    broadcast_chunk_size: int = 100
+
+    # Ротация файлов логов: по размеру или, если задан log_rotate_when
+    # (например "midnight"), по времени. Старые файлы сжимаются в gzip.
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    log_rotate_when: str | None = None
+    log_json: bool = False
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application,
+)
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def check_webhook_settings() -> None:
+    """Проверка настроек, необходимых для работы через webhook."""
+
+    if not settings.webhook_base_url:
+        logger.error("Не задан адрес для webhook.")
+        raise ValueError("Отсутствует WEBHOOK_BASE_URL.")
+    if not settings.webhook_secret:
+        logger.error("Не задан секретный токен для webhook.")
+        raise ValueError("Отсутствует WEBHOOK_SECRET.")
+
+
+def get_webhook_url() -> str:
+    """Полный адрес, на который Telegram будет отправлять обновления."""
+
+    return settings.webhook_base_url.rstrip("/") + settings.webhook_path
+
+
+def create_webhook_app(dispatcher: Dispatcher, bot: Bot) -> web.Application:
+    """
+    Создать aiohttp-приложение для приёма обновлений.
+
+    Запрос с неверным секретным токеном отклоняется, остальные
+    подтверждаются сразу, а обработка обновления идёт в фоне.
+    """
+
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dispatcher,
+        bot=bot,
+        handle_in_background=True,
+        secret_token=settings.webhook_secret,
+    ).register(app, path=settings.webhook_path)
+    setup_application(app, dispatcher, bot=bot)
+    return app
+
+
+async def set_webhook(bot: Bot, dispatcher: Dispatcher) -> None:
+    """Зарегистрировать webhook в Telegram при старте приложения."""
+
+    await bot.set_webhook(
+        get_webhook_url(),
+        secret_token=settings.webhook_secret,
+        allowed_updates=dispatcher.resolve_used_update_types(),
+    )
+    logger.info(f"Webhook установлен на {get_webhook_url()}.")
+
+
+async def start_webhook(dispatcher: Dispatcher, bot: Bot) -> None:
+    """Запуск бота в режиме webhook."""
+
+    check_webhook_settings()
+    dispatcher.startup.register(set_webhook)
+
+    runner = web.AppRunner(create_webhook_app(dispatcher, bot))
+    await runner.setup()
+    site = web.TCPSite(
+        runner, host=settings.webapp_host, port=settings.webapp_port
+    )
+    await site.start()
+
+    logger.info(
+        f"Сервер webhook запущен на "
+        f"{settings.webapp_host}:{settings.webapp_port}."
+    )
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
@@ -1,5 +1,8 @@
-from sqlalchemy import select
+from sqlalchemy import inspect, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.db import save_changes
 
 
 class CRUDBase:
@@ -7,34 +10,60 @@ class CRUDBase:
 
     def __init__(self, model) -> None:
         self.model = model
+        self.columns = set(inspect(model).column_attrs.keys()) - {"id"}
+
+    def get_column_values(self, obj_in: dict) -> dict:
+        """Оставить в словаре только колонки модели."""
+
+        return {
+            field: value
+            for field, value in obj_in.items()
+            if field in self.columns
+        }
 
     async def create(
         self,
         obj_in: dict,
         session: AsyncSession,
     ):
-        """Создать запись в БД."""
-        db_obj = self.model(**obj_in)
+        """Создать запись в БД одним запросом INSERT ... RETURNING."""
 
-        session.add(db_obj)
-        await session.commit()
-        await session.refresh(db_obj)
+        db_obj = await session.scalar(
+            insert(self.model)
+            .values(**self.get_column_values(obj_in))
+            .returning(self.model)
+        )
+        await save_changes(session)
         return db_obj
 
     async def update(self, db_obj, obj_in, session: AsyncSession):
-        """Внести изменения в объект модели в БД."""
-
-        obj_fields = db_obj.__dict__
-
-        for field in obj_fields:
-            if field in obj_in:
-                setattr(db_obj, field, obj_in[field])
+        """
+        Внести изменения в объект модели в БД.
+
+        В запрос UPDATE ... RETURNING попадают только изменённые колонки.
+        """
+
+        changed_values = {
+            field: value
+            for field, value in self.get_column_values(obj_in).items()
+            if getattr(db_obj, field) != value
+        }
+        if not changed_values:
+            return db_obj
+
+        updated_obj = await session.scalar(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**changed_values)
+            .returning(self.model)
+        )
+        await save_changes(session)
 
-        session.add(db_obj)
-        await session.commit()
-        await session.refresh(db_obj)
+        # Объект мог быть загружен в другой сессии: обновляем его вручную.
+        for field, value in changed_values.items():
+            set_committed_value(db_obj, field, value)
 
-        return db_obj
+        return updated_obj
 
     async def get(
         self,
@@ -60,7 +89,7 @@ class CRUDBase:
         """Удалить объект модели из БД."""
 
         await session.delete(db_obj)
-        await session.commit()
+        await save_changes(session)
 
         return db_obj
 
@@ -16,18 +16,5 @@ class CategoryTypeCRUD(CRUDBase):
         )
         return product_categories.scalars().all()
 
-    async def get_category_by_name(
-        self, product_id: int, field_name: str, session: AsyncSession
-    ) -> CategoryType:
-        """Получить категорию по имени."""
-
-        field = await session.execute(
-            select(self.model).where(
-                self.model.product_id == int(product_id),
-                self.model.name == field_name,
-            )
-        )
-        return field.scalars().first()
-
 
 category_product_crud = CategoryTypeCRUD(CategoryType)
@@ -1,4 +1,4 @@
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base_crud import CRUDBase
@@ -13,5 +13,48 @@ class FeedbackCRUD(CRUDBase):
         )
         return db_objs.scalars().all()
 
+    async def get_page(
+        self,
+        session: AsyncSession,
+        cursor: int | None = None,
+        backward: bool = False,
+        limit: int = 5,
+    ) -> tuple[list[Feedback], bool]:
+        """
+        Получить страницу отзывов по курсору, от новых к старым.
+
+        Курсор - id крайнего отзыва соседней страницы, его дата
+        берётся подзапросом. Выбирается limit + 1 строка: лишняя строка
+        означает, что в выбранном направлении есть ещё страница.
+        """
+
+        sort_key = tuple_(self.model.feedback_date, self.model.id)
+        statement = select(self.model)
+        if cursor is not None:
+            cursor_key = tuple_(
+                select(self.model.feedback_date)
+                .where(self.model.id == int(cursor))
+                .scalar_subquery(),
+                int(cursor),
+            )
+            statement = statement.where(
+                sort_key > cursor_key if backward else sort_key < cursor_key
+            )
+        if backward:
+            statement = statement.order_by(
+                self.model.feedback_date, self.model.id
+            )
+        else:
+            statement = statement.order_by(
+                desc(self.model.feedback_date), desc(self.model.id)
+            )
+
+        feedbacks = list(await session.scalars(statement.limit(limit + 1)))
+        has_more = len(feedbacks) > limit
+        feedbacks = feedbacks[:limit]
+        if backward:
+            feedbacks.reverse()
+        return feedbacks, has_more
+
 
 feedback_crud = FeedbackCRUD(Feedback)
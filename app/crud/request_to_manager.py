@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, case, desc, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.db import save_changes
 from models.models import ContactManager
 
 
@@ -11,15 +12,16 @@ async def create_request_to_manager(
 ) -> ContactManager:
     """Создание заявки на связь с менеджером."""
 
-    data_to_db = ContactManager(
-        **user_data,
-        need_support=(request_type == "callback_request"),
-        need_contact_with_manager=(request_type == "contact_manager")
+    data_to_db = await session.scalar(
+        insert(ContactManager)
+        .values(
+            **user_data,
+            need_support=(request_type == "callback_request"),
+            need_contact_with_manager=(request_type == "contact_manager")
+        )
+        .returning(ContactManager)
     )
-
-    session.add(data_to_db)
-    await session.commit()
-    await session.refresh(data_to_db)
+    await save_changes(session)
 
     return data_to_db
 
@@ -35,36 +37,40 @@ async def get_request(
     return request.scalars().first()
 
 
-async def get_all_support_requests(
+async def get_requests_page(
+    need_column,
     session: AsyncSession,
-) -> list[ContactManager]:
-    """Получить список активных заявок на поддержку."""
-
-    support_requests = await session.execute(
-        select(ContactManager).where(
-            and_(
-                ContactManager.shipping_date_close.is_(None),
-                ContactManager.need_support.is_(True),
-            )
-        )
+    cursor: int | None = None,
+    backward: bool = False,
+    limit: int = 5,
+) -> tuple[list[ContactManager], bool]:
+    """
+    Получить страницу активных заявок по курсору.
+
+    Заявки упорядочены по id, курсор - id крайней заявки соседней
+    страницы. Выбирается limit + 1 строка: лишняя строка означает,
+    что в выбранном направлении есть ещё страница.
+    """
+
+    statement = select(ContactManager).where(
+        ContactManager.shipping_date_close.is_(None),
+        need_column.is_(True),
     )
-    return support_requests.scalars().all()
-
-
-async def get_all_manager_requests(
-    session: AsyncSession,
-) -> list[ContactManager]:
-    """Получить список активных заявок на звонок менеджера."""
-
-    support_requests = await session.execute(
-        select(ContactManager).where(
-            and_(
-                ContactManager.shipping_date_close.is_(None),
-                ContactManager.need_contact_with_manager.is_(True),
-            )
-        )
-    )
-    return support_requests.scalars().all()
+    if backward:
+        if cursor is not None:
+            statement = statement.where(ContactManager.id < int(cursor))
+        statement = statement.order_by(ContactManager.id.desc())
+    else:
+        if cursor is not None:
+            statement = statement.where(ContactManager.id > int(cursor))
+        statement = statement.order_by(ContactManager.id)
+
+    requests = list(await session.scalars(statement.limit(limit + 1)))
+    has_more = len(requests) > limit
+    requests = requests[:limit]
+    if backward:
+        requests.reverse()
+    return requests, has_more
 
 
 async def close_case(
@@ -72,19 +78,26 @@ async def close_case(
 ) -> tuple:
     """Закрыть заявку."""
 
-    case_to_close = await get_request(int(request_id), session)
-
-    if case_to_close.need_contact_with_manager:
-        setattr(case_to_close, "need_contact_with_manager", False)
-    elif case_to_close.need_support:
-        setattr(case_to_close, "need_support", False)
-
-    setattr(case_to_close, "shipping_date_close", datetime.now())
-    setattr(case_to_close, "manager_id", int(manager_id))
-
-    session.add(case_to_close)
-    await session.commit()
-    await session.refresh(case_to_close)
+    # Снимается только один флаг: звонок менеджера, а если его не было,
+    # то техподдержка. В SET колонки имеют значения до обновления.
+    case_to_close = await session.scalar(
+        update(ContactManager)
+        .where(ContactManager.id == int(request_id))
+        .values(
+            need_contact_with_manager=False,
+            need_support=case(
+                (
+                    ContactManager.need_contact_with_manager.is_(True),
+                    ContactManager.need_support,
+                ),
+                else_=False,
+            ),
+            shipping_date_close=datetime.now(),
+            manager_id=int(manager_id),
+        )
+        .returning(ContactManager)
+    )
+    await save_changes(session)
     return case_to_close
 
 
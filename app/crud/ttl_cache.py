@@ -0,0 +1,55 @@
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Кеш с ограниченным временем жизни записей и размером.
+
+    Используется для ролей пользователей по tg_id, где кешируется
+    и отсутствие пользователя в БД (значение None), чтобы фильтры
+    админ-роутеров не ходили в БД на каждое сообщение обычного
+    пользователя, и как множество известных пользователей.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: dict[Hashable, tuple[Any, float]] = {}
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Вернуть (найдено ли значение, значение)."""
+
+        cached = self._items.get(key)
+        if cached is None:
+            return False, None
+
+        value, expires_at = cached
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            return False, None
+        return True, value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key)[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохранить значение."""
+
+        if key not in self._items and len(self._items) >= self.max_size:
+            # Словарь хранит порядок вставки: вытесняем самую старую запись.
+            del self._items[next(iter(self._items))]
+        self._items[key] = (value, time.monotonic() + self.ttl)
+
+    def add(self, key: Hashable) -> None:
+        """Запомнить ключ без значения."""
+
+        self.set(key, None)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Сбросить запись или весь кеш, если ключ не указан."""
+
+        if key is None:
+            self._items.clear()
+        else:
+            self._items.pop(key, None)
@@ -1,11 +1,26 @@
-from sqlalchemy import select, or_
+from functools import partial
+
+from sqlalchemy import select, or_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base_crud import CRUDBase
+from .ttl_cache import TTLCache
+from core.db import run_after_commit, save_changes
+from core.settings import settings
 from models.models import User, RoleEnum
+from redis_db.invalidation import invalidation_listener, publish_invalidation
+
+ROLE_CHANNEL = "role_changed"
 
 
 class UserCRUD(CRUDBase):
+    role_cache = TTLCache(settings.role_cache_ttl)
+    # tg_id пользователей, которые точно есть в БД. Записи живут
+    # ограниченное время, поэтому кеш не растёт без предела и не держит
+    # пользователей, удалённых в обход бота.
+    known_users = TTLCache(settings.role_cache_ttl)
+
     async def get_user_by_tg_id(
         self, tg_id: int, session: AsyncSession
     ) -> User:
@@ -17,6 +32,64 @@ class UserCRUD(CRUDBase):
 
         return user.scalars().first()
 
+    async def ensure_user(self, tg_id: int, session: AsyncSession) -> bool:
+        """
+        Зарегистрировать пользователя, если его ещё нет в БД.
+
+        Один запрос INSERT ... ON CONFLICT DO NOTHING вместо проверки
+        и создания; повторные вызовы для известного пользователя
+        не обращаются к БД. Возвращает True, если пользователь создан.
+        """
+
+        tg_id = int(tg_id)
+        if tg_id in self.known_users:
+            return False
+
+        result = await session.execute(
+            insert(self.model)
+            .values(tg_id=tg_id)
+            .on_conflict_do_nothing(index_elements=[self.model.tg_id])
+            .returning(self.model.id)
+        )
+        is_created = result.scalar() is not None
+        if is_created:
+            await save_changes(session)
+
+        async def remember_user() -> None:
+            self.known_users.add(tg_id)
+
+        await run_after_commit(session, remember_user)
+        return is_created
+
+    async def ensure_users(
+        self,
+        tg_ids: list[int],
+        session: AsyncSession,
+        role: RoleEnum = RoleEnum.USER,
+    ) -> None:
+        """
+        Зарегистрировать недостающих пользователей одним запросом.
+
+        Роль уже существующих пользователей не меняется.
+        """
+
+        tg_ids = {int(tg_id) for tg_id in tg_ids}
+        if not tg_ids:
+            return
+
+        await session.execute(
+            insert(self.model)
+            .values([{"tg_id": tg_id, "role": role} for tg_id in tg_ids])
+            .on_conflict_do_nothing(index_elements=[self.model.tg_id])
+        )
+        await save_changes(session)
+
+        async def remember_users() -> None:
+            for tg_id in tg_ids:
+                self.known_users.add(tg_id)
+
+        await run_after_commit(session, remember_users)
+
     async def get_role_by_tg_id(
         self, tg_id: int, session: AsyncSession
     ) -> User:
@@ -28,6 +101,27 @@ class UserCRUD(CRUDBase):
 
         return result.scalar()
 
+    async def get_cached_role_by_tg_id(
+        self, tg_id: int, session: AsyncSession
+    ) -> RoleEnum | None:
+        """Получить роль пользователя, по возможности без запроса в БД."""
+
+        is_cached, role = self.role_cache.get(int(tg_id))
+        if not is_cached:
+            role = await self.get_role_by_tg_id(tg_id, session)
+            self.role_cache.set(int(tg_id), role)
+        return role
+
+    async def _on_role_changed(self, data: str | None) -> None:
+        tg_id = int(data) if data else None
+        self.role_cache.invalidate(tg_id)
+        self.known_users.invalidate(tg_id)
+
+    async def _forget_user(self, tg_id: int) -> None:
+        self.role_cache.invalidate(tg_id)
+        self.known_users.invalidate(tg_id)
+        await publish_invalidation(ROLE_CHANNEL, str(tg_id))
+
     async def get_manager_and_admin_list(
         self, session: AsyncSession
     ) -> list[User]:
@@ -42,6 +136,42 @@ class UserCRUD(CRUDBase):
         )
         return manager_list.scalars().all()
 
+    async def get_broadcast_recipients(
+        self, after_id: int, limit: int, session: AsyncSession
+    ) -> list[tuple[int, int]]:
+        """
+        Следующая порция пар (id, tg_id) получателей рассылки.
+
+        Порции выбираются по возрастанию id после after_id, поэтому
+        каждая читается коротким запросом по первичному ключу.
+        Пользователи, заблокировавшие бота, пропускаются.
+        """
+
+        result = await session.execute(
+            select(self.model.id, self.model.tg_id)
+            .where(
+                self.model.id > after_id,
+                self.model.blocked_bot.is_(False),
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def set_blocked_bot(
+        self, tg_ids: list[int], blocked: bool, session: AsyncSession
+    ) -> None:
+        """Отметить, что пользователи заблокировали или разблокировали бота."""
+
+        if not tg_ids:
+            return
+        await session.execute(
+            update(self.model)
+            .where(self.model.tg_id.in_([int(tg_id) for tg_id in tg_ids]))
+            .values(blocked_bot=blocked)
+        )
+        await save_changes(session)
+
     async def update(
         self,
         user: User,
@@ -52,12 +182,25 @@ class UserCRUD(CRUDBase):
         """
         Поменять роль для пользователя и присвоить ему имя(необязательно).
         """
+        obj_in = {"role": new_role}
         if name:
-            setattr(user, "name", name)
-        setattr(user, "role", new_role)
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
+            obj_in["name"] = name
+        user = await super().update(user, obj_in, session)
+
+        async def invalidate_role() -> None:
+            self.role_cache.invalidate(user.tg_id)
+            await publish_invalidation(ROLE_CHANNEL, str(user.tg_id))
+
+        await run_after_commit(session, invalidate_role)
+
+    async def remove(self, user: User, session: AsyncSession) -> User:
+        """Удалить пользователя и сбросить его записи в кешах."""
+
+        tg_id = user.tg_id
+        user = await super().remove(user, session)
+        await run_after_commit(session, partial(self._forget_user, tg_id))
+        return user
 
 
 user_crud = UserCRUD(User)
+invalidation_listener.subscribe(ROLE_CHANNEL, user_crud._on_role_changed)
@@ -1,5 +1,4 @@
 import logging
-import asyncio
 
 from aiogram.types import Message, CallbackQuery
 from aiogram import Bot
@@ -10,10 +9,13 @@ import bot.bot_const as bc
 from bot.exceptions import message_exception_handler
 from bot.keyborads import get_feedback_keyboard
 from bot.bot_const import Form, FeedbackForm
-from loggers.log import setup_logging
-from redis_db.connect import get_redis_connection
+from bot.inactivity import InactivityScheduler
+from core.bot_setup import bot
+from core.metrics import Gauge
+from core.settings import settings
+from redis_db.create_timer import inactivity_timeout_cache
+from redis_db.inactivity import RedisInactivityScheduler
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,37 @@ def get_user_id(message: Message | CallbackQuery) -> int:
     return message.from_user.id
 
 
-user_timers = {}
+async def send_feedback_request(user_id: int) -> None:
+    """Предложить неактивному пользователю оставить отзыв."""
+
+    logger.info(f"Пользователь {user_id} неактивен. Отправка сообщения.")
+
+    await bot.send_message(
+        user_id,
+        bc.MESSAGE_FOR_GET_FEEDBACK,
+        reply_markup=get_feedback_keyboard,
+    )
+
+    logger.info(
+        f"Таймер для пользователя {user_id} удалён "
+        f"после отправки сообщения."
+    )
+
+
+if settings.inactivity_timers_storage == "memory":
+    inactivity_scheduler = InactivityScheduler(
+        on_expire=send_feedback_request
+    )
+else:
+    inactivity_scheduler = RedisInactivityScheduler(
+        on_expire=send_feedback_request
+    )
+
+Gauge(
+    "inactivity_timers_pending",
+    "Количество запущенных таймеров бездействия.",
+    func=lambda: inactivity_scheduler.pending,
+)
 
 
 @message_exception_handler(log_error_text="Ошибка запуска таймера.")
@@ -40,62 +72,22 @@ async def start_inactivity_timer(
     """
 
     try:
-        redis_client = await get_redis_connection()
-        timeout = await redis_client.get("timeout")
-        timeout = int(timeout) if timeout else default_timeout
+        timeout = await inactivity_timeout_cache.get(default_timeout)
     except Exception as e:
-        logger.error(f"Не удалось установить соединение с Redis: {e}")
+        logger.error(f"Не удалось получить таймаут из Redis: {e}")
         timeout = default_timeout
 
     logger.info(
         f"Запуск таймера для пользователя {user_id} с таймаутом {timeout}."
     )
 
-    if user_id in user_timers:
-        user_timers[user_id].cancel()
-
-    user_timers[user_id] = asyncio.create_task(
-        inactivity_timer(user_id, bot, timeout)
-    )
+    await inactivity_scheduler.schedule(user_id, timeout)
 
     logger.info(f"Новый таймер запущен для пользователя {user_id}.")
 
-    if 'redis_client' in locals() and redis_client:
-        await redis_client.close()
-
     return None
 
 
-@message_exception_handler(
-    log_error_text="Ошибка периода бездействия и отправки сообщения."
-)
-async def inactivity_timer(user_id: int, bot: Bot, timeout: int):
-    """Ожидания периода бездействия и отправки сообщения."""
-
-    try:
-        await asyncio.sleep(timeout)
-
-        logger.info(f"Пользователь {user_id} неактивен. Отправка сообщения.")
-
-        if user_id in user_timers:
-            await bot.send_message(
-                user_id,
-                bc.MESSAGE_FOR_GET_FEEDBACK,
-                reply_markup=get_feedback_keyboard,
-            )
-
-            del user_timers[user_id]
-
-            logger.info(
-                f"Таймер для пользователя {user_id} удалён "
-                f"после отправки сообщения."
-            )
-
-    except asyncio.CancelledError:
-        logger.info(f"Таймер для пользователя {user_id} был отменён.")
-        pass
-
-
 @message_exception_handler(
     log_error_text="Ошибка при переходе к следующему вопросу."
 )
@@ -1,10 +1,29 @@
+import atexit
+import copy
+import gzip
+import json
 import logging
+import os
+import queue
+import shutil
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 
+from core.settings import settings
+
 
 log_dir = Path(__file__).parent / "log_levels"
 log_dir.mkdir(exist_ok=True)
 
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+_listener: QueueListener | None = None
+
 
 class LevelFilter(logging.Filter):
     """Фильтр для логирования сообщений только определенного уровня."""
@@ -16,65 +35,150 @@ class LevelFilter(logging.Filter):
         return record.levelno == self.level
 
 
-def setup_logging():
-    """Настройка логирования для разных уровней."""
-
-    logger = logging.getLogger()
+class JsonFormatter(logging.Formatter):
+    """Форматирование записи лога в одну строку JSON."""
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Обработчик, который кладёт записи в очередь для QueueListener.
+
+    В отличие от QueueHandler, не склеивает traceback с текстом
+    сообщения: он передаётся в exc_text, чтобы обработчики потока
+    логирования вывели его в своём формате.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+        record.exc_info = None
+        return record
+
+
+def gzip_namer(name: str) -> str:
+    """Имя архива для файла лога после ротации."""
+    return f"{name}.gz"
+
+
+def gzip_rotator(source: str, dest: str) -> None:
+    """Сжать файл лога после ротации."""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def get_formatter() -> logging.Formatter:
+    """Формат записей: текст или JSON, в зависимости от настроек."""
+    if settings.log_json:
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT)
+
+
+def get_file_handler(filename: str, level: int) -> logging.Handler:
+    """
+    Файловый обработчик с ротацией по размеру или по времени.
+
+    Старые файлы сжимаются в gzip.
+    """
+    if settings.log_rotate_when:
+        handler = TimedRotatingFileHandler(
+            log_dir / filename,
+            when=settings.log_rotate_when,
+            backupCount=settings.log_backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+    else:
+        handler = RotatingFileHandler(
+            log_dir / filename,
+            maxBytes=settings.log_max_bytes,
+            backupCount=settings.log_backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+    handler.namer = gzip_namer
+    handler.rotator = gzip_rotator
+    handler.setLevel(level)
+    handler.setFormatter(get_formatter())
+    return handler
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
 
-    info_handler = logging.FileHandler(log_dir / "info.log", encoding="utf-8")
-    info_handler.setLevel(logging.INFO)
-    info_handler.addFilter(LevelFilter(logging.INFO))
-    info_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
+def setup_logging():
+    """
+    Настройка логирования для разных уровней.
+
+    Корневой логгер только кладёт записи в очередь, а запись в файлы
+    и консоль выполняет отдельный поток QueueListener, поэтому
+    логирование не блокирует цикл событий. Повторный вызов ничего
+    не делает.
+    """
+
+    global _listener
+    if _listener is not None:
+        return
+
+    handlers = []
+    for filename, level in (
+        ("info.log", logging.INFO),
+        ("error.log", logging.ERROR),
+        ("debug.log", logging.DEBUG),
+    ):
+        handler = get_file_handler(filename, level)
+        handler.addFilter(LevelFilter(level))
+        handlers.append(handler)
 
-    error_handler = logging.FileHandler(log_dir / "error.log", encoding="utf-8")
-    error_handler.setLevel(logging.ERROR)
-    error_handler.addFilter(LevelFilter(logging.ERROR))
-    error_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(get_formatter())
+    handlers.append(console_handler)  # вывод в консоль
 
-    debug_handler = logging.FileHandler(log_dir / "debug.log", encoding="utf-8")
-    debug_handler.setLevel(logging.DEBUG)
-    debug_handler.addFilter(LevelFilter(logging.DEBUG))
-    debug_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
+    # Записи alembic приходят в общую очередь через корневой логгер.
+    alembic_info_handler = get_file_handler("alembic_info.log", logging.INFO)
+    alembic_info_handler.addFilter(logging.Filter("alembic"))
+    handlers.append(alembic_info_handler)
+    logging.getLogger("alembic").setLevel(logging.INFO)
 
+    log_queue = queue.Queue(-1)
+    logger = logging.getLogger()
+    logger.handlers.clear()
     logger.setLevel(logging.DEBUG)
-    logger.addHandler(info_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(debug_handler)
+    logger.addHandler(LogQueueHandler(log_queue))
 
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    _listener = QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
-    logger.addHandler(console_handler)  # вывод в консоль
+    _listener.start()
+    atexit.register(stop_logging)
 
-    alembic_logger = logging.getLogger("alembic")
-    alembic_logger.setLevel(logging.INFO)
 
-    alembic_info_handler = logging.FileHandler(
-        log_dir / "alembic_info.log", encoding="utf-8"
-    )
-    alembic_info_handler.setLevel(logging.INFO)
-    alembic_info_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
-    alembic_logger.addHandler(alembic_info_handler)
-
-    alembic_error_handler = logging.FileHandler(
-        log_dir / "alembic_error.log", encoding="utf-8"
-    )
-    alembic_error_handler.setLevel(logging.ERROR)
-    alembic_error_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
+def stop_logging():
+    """Дописать записи из очереди и остановить поток логирования."""
 
-    # alembic_logger.addHandler(alembic_error_handler) вывод в консоль
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -2,15 +2,24 @@ import logging
 import asyncio
 
 from core.db import AsyncSessionLocal
-from middlewares.middleware import DataBaseSession
+from middlewares.middleware import DataBaseSession, callback_routing_index
 
 from core.bot_setup import bot, dispatcher, check_token
+from core.metrics_server import metrics_server
+from core.settings import settings
+from core.webhook import start_webhook
+from redis_db.connect import check_redis_connection, close_redis_connection
+from redis_db.invalidation import invalidation_listener
 from bot.handlers import router as message_router
 from bot.callbacks import router as callback_router
 from bot.fsm_contexts.manager_context import router as fsm_context_router
 from bot.fsm_contexts.feedback_context import router as feedback_context
+from bot.broadcast import broadcaster
+from bot.manager_notifications import manager_notifier
+from bot.smtp import mail_outbox_worker
 from core.init_db import add_portfolio, set_admin
 from admin.handlers.admin_handlers import admin_router
+from helpers import inactivity_scheduler
 from loggers.log import setup_logging
 
 
@@ -38,9 +47,26 @@ async def main() -> None:
         dispatcher.update.middleware(
             DataBaseSession(session_pool=AsyncSessionLocal)
         )
-        await add_portfolio()
-        await set_admin()
-        await dispatcher.start_polling(bot)
+        dispatcher.callback_query.outer_middleware(callback_routing_index)
+        dispatcher.shutdown.register(inactivity_scheduler.stop)
+        dispatcher.shutdown.register(invalidation_listener.stop)
+        dispatcher.shutdown.register(mail_outbox_worker.stop)
+        dispatcher.shutdown.register(manager_notifier.stop)
+        dispatcher.shutdown.register(broadcaster.stop)
+        dispatcher.shutdown.register(close_redis_connection)
+        dispatcher.shutdown.register(metrics_server.stop)
+        await check_redis_connection()
+        await metrics_server.start()
+        await asyncio.gather(add_portfolio(), set_admin())
+        inactivity_scheduler.start()
+        invalidation_listener.start()
+        mail_outbox_worker.start()
+        manager_notifier.start()
+        broadcaster.start()
+        if settings.use_webhook:
+            await start_webhook(dispatcher, bot)
+        else:
+            await dispatcher.start_polling(bot)
 
     except Exception as e:
         logger.error(f"Критическая ошибка в работе бота: {e}")
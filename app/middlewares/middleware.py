@@ -1,15 +1,45 @@
-from typing import Any, Awaitable, Callable, Dict
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable
 
-from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject
+from aiogram import BaseMiddleware, Bot, Router
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.types import CallbackQuery, TelegramObject
 
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.db import AFTER_COMMIT, UNIT_OF_WORK
+from core.metrics import Counter, Gauge, Histogram
 
 
 class DataBaseSession(BaseMiddleware):
+    """
+    Сессия БД на одно обновление в режиме единицы работы.
+
+    CRUD делает только flush, а commit выполняет middleware после
+    обработчика, затем запускает отложенные через run_after_commit
+    действия, в том числе сообщения об успешном сохранении. При ошибке
+    транзакция откатывается, а отложенные действия отменяются.
+    AsyncSession берёт соединение из пула только при первом запросе,
+    поэтому обработчики без работы с БД пула не касаются.
+    """
+
     def __init__(self, session_pool: async_sessionmaker):
         self.session_pool = session_pool
 
+    @staticmethod
+    async def rollback(session: AsyncSession) -> None:
+        """Откатить транзакцию и отменить отложенные действия."""
+
+        await session.rollback()
+        session.info.pop(AFTER_COMMIT, None)
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
@@ -17,5 +47,238 @@ class DataBaseSession(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
         async with self.session_pool() as session:
+            session.info[UNIT_OF_WORK] = True
             data["session"] = session
-            return await handler(event, data)
+            try:
+                result = await handler(event, data)
+                if not session.is_active:
+                    # Обработчик сам перехватил ошибку flush: транзакцию
+                    # нельзя зафиксировать, а подтверждения не отправляются.
+                    await self.rollback(session)
+                    return result
+                await session.commit()
+            except Exception:
+                await self.rollback(session)
+                raise
+            for callback in session.info.pop(AFTER_COMMIT, []):
+                await callback()
+            return result
+
+
+class CallbackRoutingIndex(BaseMiddleware):
+    """
+    Индекс маршрутизации callback-запросов по callback_data.
+
+    Регистрируется внешним middleware на dispatcher.callback_query.
+    Если callback_data совпадает с зарегистрированным значением или
+    префиксом, событие сразу передаётся роутеру-владельцу, минуя фильтры
+    остальных роутеров (в первую очередь админских). Остальные события
+    и события, не обработанные роутером-владельцем, идут по обычной
+    цепочке роутеров.
+
+    Префикс — часть callback_data до первого разделителя вместе
+    с ним (например, "answer:"), поэтому поиск роутера — одно обращение
+    к словарю при любом числе префиксов.
+    """
+
+    separator = ":"
+
+    def __init__(self) -> None:
+        self._exact: dict[str, Router] = {}
+        self._prefixes: dict[str, Router] = {}
+
+    def register(
+        self,
+        router: Router,
+        exact: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+    ) -> None:
+        """Закрепить значения и префиксы callback_data за роутером."""
+
+        for value in exact:
+            self._exact[value] = router
+        for prefix in prefixes:
+            head, separator, tail = prefix.partition(self.separator)
+            if not separator or tail:
+                raise ValueError(
+                    f"Префикс {prefix!r} должен заканчиваться "
+                    f"разделителем {self.separator!r}."
+                )
+            self._prefixes[head] = router
+
+    def resolve(self, callback_data: str | None) -> Router | None:
+        """Найти роутер, которому принадлежит callback_data."""
+
+        if not callback_data:
+            return None
+        router = self._exact.get(callback_data)
+        if router is None:
+            head, separator, _ = callback_data.partition(self.separator)
+            if separator:
+                router = self._prefixes.get(head)
+        return router
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        router = self.resolve(event.data)
+        if router is not None:
+            result = await router.propagate_event(
+                "callback_query", event, **data
+            )
+            if result is not UNHANDLED:
+                return result
+        return await handler(event, data)
+
+
+callback_routing_index = CallbackRoutingIndex()
+
+
+bot_api_queue_wait_seconds = Histogram(
+    "bot_api_queue_wait_seconds",
+    "Время ожидания запроса к Bot API в ограничителе частоты в секундах.",
+)
+bot_api_waiting_requests = Gauge(
+    "bot_api_waiting_requests",
+    "Число запросов к Bot API, ожидающих своей очереди.",
+)
+bot_api_retry_after_total = Counter(
+    "bot_api_retry_after_total",
+    "Сколько раз Telegram ответил 429 и попросил повторить позже.",
+)
+
+
+class TokenBucket:
+    """
+    Ведро токенов: rate запросов в секунду, всплеск до capacity.
+
+    Токены резервируются заранее и могут уходить в минус: тогда
+    запрос ждёт, пока ведро не наполнится до его очереди. Так запросы
+    обслуживаются в порядке поступления без блокировок.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+    def reserve(self) -> float:
+        """Занять токен и вернуть, сколько секунд ждать до отправки."""
+
+        self._refill()
+        self.tokens -= 1
+        return 0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Не выдавать токены ближайшие seconds секунд."""
+
+        self._refill()
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+
+class OutgoingRateLimiter(BaseRequestMiddleware):
+    """
+    Ограничение частоты исходящих запросов к Bot API.
+
+    Регистрируется на сессии бота. Лимиты Telegram касаются сообщений
+    в чаты, поэтому ограничиваются только методы с chat_id: каждый
+    такой запрос сначала ждёт ведро своего чата (около одного
+    сообщения в секунду), а затем общее ведро токенов (около 30
+    сообщений в секунду). Токен общего ведра берётся только после
+    того, как чат свободен, поэтому ожидание одного чата не расходует
+    общий лимит. Остальные методы, в том числе GetUpdates
+    и AnswerCallbackQuery, отправляются без ожидания.
+
+    На ответ 429 приостанавливается только ведро чата, а запрос
+    без chat_id просто повторяется после паузы. Обработчики не видят
+    TelegramRetryAfter, пока не исчерпаны попытки.
+    """
+
+    def __init__(
+        self,
+        rate: float = 30,
+        chat_rate: float = 1,
+        chat_burst: float = 3,
+        max_retries: int = 3,
+        max_chat_buckets: int = 10000,
+    ) -> None:
+        self.global_bucket = TokenBucket(rate)
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+        self.max_chat_buckets = max_chat_buckets
+        self._chat_buckets: dict[int | str, TokenBucket] = {}
+
+    def get_chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        """Ведро токенов чата, создаётся при первом запросе."""
+
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chat_buckets) >= self.max_chat_buckets:
+                # Полное ведро ничем не отличается от нового.
+                self._chat_buckets = {
+                    key: value
+                    for key, value in self._chat_buckets.items()
+                    if not value.is_full
+                }
+            bucket = TokenBucket(self.chat_rate, self.chat_burst)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    async def _wait(self, buckets: list[TokenBucket]) -> None:
+        """Занять токены вёдер по очереди, дожидаясь каждого."""
+
+        if not buckets:
+            return
+        started = time.monotonic()
+        bot_api_waiting_requests.inc()
+        try:
+            for bucket in buckets:
+                delay = bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            bot_api_waiting_requests.dec()
+        bot_api_queue_wait_seconds.observe(time.monotonic() - started)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Response:
+        buckets = []
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is not None:
+            buckets = [self.get_chat_bucket(chat_id), self.global_bucket]
+
+        for attempt in range(self.max_retries + 1):
+            await self._wait(buckets)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                bot_api_retry_after_total.inc()
+                if attempt == self.max_retries:
+                    raise
+                if chat_id is not None:
+                    # Флуд-контроль одного чата не должен останавливать
+                    # ответы остальным пользователям.
+                    buckets[0].pause(e.retry_after)
+                else:
+                    await asyncio.sleep(e.retry_after)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, and_, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 import sqlalchemy.dialects.postgresql as pgsql_types
@@ -45,6 +45,13 @@ class User(Base):
         server_default=func.now(),
         nullable=False,
     )
+    # Пользователь заблокировал бота: рассылки его пропускают.
+    blocked_bot: Mapped[bool] = mapped_column(
+        pgsql_types.BOOLEAN,
+        default=False,
+        server_default=false(),
+        nullable=False,
+    )
     closed_requests: Mapped[list["ContactManager"]] = relationship(
         "ContactManager", back_populates="manager"
     )
@@ -166,6 +173,30 @@ class ContactManager(Base):
     )
 
 
+# Частичные индексы открытых заявок и индекс для статистики менеджера.
+Index(
+    "ix_contactmanager_open_support",
+    ContactManager.id,
+    postgresql_where=and_(
+        ContactManager.shipping_date_close.is_(None),
+        ContactManager.need_support.is_(True),
+    ),
+)
+Index(
+    "ix_contactmanager_open_manager",
+    ContactManager.id,
+    postgresql_where=and_(
+        ContactManager.shipping_date_close.is_(None),
+        ContactManager.need_contact_with_manager.is_(True),
+    ),
+)
+Index(
+    "ix_contactmanager_manager_id_closed",
+    ContactManager.manager_id,
+    ContactManager.shipping_date_close.desc(),
+)
+
+
 class Feedback(Base):
     """БД модель для отзывов."""
 
@@ -1,9 +1,70 @@
+import logging
+
 import redis.asyncio as aioredis
 
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+redis_client: aioredis.Redis | None = None
+
+
+def create_redis_pool() -> aioredis.BlockingConnectionPool:
+    """
+    Пул соединений Redis по настройкам проекта.
 
-async def get_redis_connection():
-    """Подключение к Redis."""
+    При исчерпании пула запрос ждёт свободное соединение
+    не дольше REDIS_POOL_TIMEOUT секунд.
+    """
 
-    return await aioredis.from_url(
-        "redis://158.160.77.163:6379", decode_responses=True  # localhost:
+    connection_kwargs = dict(
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        decode_responses=True,
     )
+
+    if settings.redis_unix_socket_path:
+        return aioredis.BlockingConnectionPool(
+            connection_class=aioredis.UnixDomainSocketConnection,
+            path=settings.redis_unix_socket_path,
+            **connection_kwargs,
+        )
+
+    return aioredis.BlockingConnectionPool.from_url(
+        settings.redis_url, **connection_kwargs
+    )
+
+
+def get_redis_connection() -> aioredis.Redis:
+    """Общий для всего процесса клиент Redis поверх пула соединений."""
+
+    global redis_client
+
+    if redis_client is None:
+        redis_client = aioredis.Redis(connection_pool=create_redis_pool())
+
+    return redis_client
+
+
+async def check_redis_connection() -> None:
+    """Проверить доступность Redis при запуске бота."""
+
+    try:
+        await get_redis_connection().ping()
+        logger.info("Соединение с Redis установлено.")
+    except Exception as e:
+        logger.error(f"Не удалось установить соединение с Redis: {e}")
+
+
+async def close_redis_connection() -> None:
+    """Закрыть пул соединений Redis при остановке бота."""
+
+    global redis_client
+
+    if redis_client is not None:
+        await redis_client.aclose(close_connection_pool=True)
+        redis_client = None
+        logger.info("Пул соединений Redis закрыт.")
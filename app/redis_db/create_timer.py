@@ -1,19 +1,55 @@
 import logging
 
-from loggers.log import setup_logging
 from redis_db.connect import get_redis_connection
+from redis_db.invalidation import invalidation_listener, publish_invalidation
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
+TIMEOUT_KEY = "timeout"
+TIMEOUT_CHANNEL = "timeout_changed"
+
+
+class InactivityTimeoutCache:
+    """
+    Таймаут бездействия, закешированный в памяти процесса.
+
+    Значение читается из Redis один раз и обновляется по сообщению
+    в канале TIMEOUT_CHANNEL, когда администратор меняет таймер.
+    """
+
+    def __init__(self) -> None:
+        self.timeout: int | None = None
+        self.is_loaded = False
+
+    async def get(self, default_timeout: int) -> int:
+        """Текущий таймаут или значение по умолчанию, если он не задан."""
+
+        if not self.is_loaded:
+            await self.refresh()
+
+        return self.timeout or default_timeout
+
+    async def refresh(self, data: str | None = None) -> None:
+        """Обновить таймаут из сообщения или перечитать его из Redis."""
+
+        if not data:
+            data = await get_redis_connection().get(TIMEOUT_KEY)
+
+        self.timeout = int(data) if data else None
+        self.is_loaded = True
+
+
+inactivity_timeout_cache = InactivityTimeoutCache()
+invalidation_listener.subscribe(
+    TIMEOUT_CHANNEL, inactivity_timeout_cache.refresh
+)
+
 
 async def set_user_timeout(user_id: int, timeout: int):
     """Устанавливает таймаут для пользователя в Redis."""
 
-    redis_client = await get_redis_connection()
-
-    await redis_client.set("timeout", timeout)
-    await redis_client.close()
+    await get_redis_connection().set(TIMEOUT_KEY, timeout)
+    await publish_invalidation(TIMEOUT_CHANNEL, str(timeout))
 
     logger.info(
         f"Таймаут для пользователя {user_id} установлен на {timeout} секунд."
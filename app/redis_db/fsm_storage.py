@@ -0,0 +1,28 @@
+import json
+from functools import partial
+
+from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
+
+from core.settings import settings
+from redis_db.connect import get_redis_connection
+
+# Компактный JSON: без пробелов и без экранирования кириллицы.
+compact_json_dumps = partial(
+    json.dumps, ensure_ascii=False, separators=(",", ":")
+)
+
+
+def get_fsm_storage() -> RedisStorage:
+    """
+    Хранилище состояний FSM в Redis.
+
+    Состояния переживают перезапуск бота и общие для всех его реплик.
+    """
+
+    return RedisStorage(
+        redis=get_redis_connection(),
+        key_builder=DefaultKeyBuilder(prefix="fsm"),
+        state_ttl=settings.fsm_state_ttl,
+        data_ttl=settings.fsm_data_ttl,
+        json_dumps=compact_json_dumps,
+    )
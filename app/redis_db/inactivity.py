@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from redis_db.connect import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+DEADLINES_KEY = "inactivity:deadlines"
+POLLER_LEASE_KEY = "inactivity:poller"
+
+# Атомарно забрать истёкшие сроки: каждый срок достанется ровно одному
+# вызову, даже если опрашивающих процессов несколько.
+CLAIM_EXPIRED_SCRIPT = """
+local expired = redis.call(
+    'ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2]
+)
+if #expired > 0 then
+    redis.call('ZREM', KEYS[1], unpack(expired))
+end
+return expired
+"""
+
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisInactivityScheduler:
+    """
+    Таймеры бездействия в сортированном множестве Redis.
+
+    Сроки переживают перезапуск бота. Истёкшие сроки забирает только
+    процесс, удерживающий аренду, поэтому сообщение пользователю
+    отправляется один раз при любом количестве реплик.
+    """
+
+    def __init__(
+        self,
+        on_expire: Callable[[int], Awaitable[None]],
+        poll_interval: float = 1,
+        lease_ttl: float = 10,
+        batch_size: int = 100,
+    ) -> None:
+        self.on_expire = on_expire
+        self.poll_interval = poll_interval
+        self.lease_ttl_ms = int(lease_ttl * 1000)
+        self.batch_size = batch_size
+        self.token = uuid.uuid4().hex
+        self.is_leader = False
+        self._pending = 0
+        self._task: asyncio.Task | None = None
+        self._callbacks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Количество запущенных таймеров на момент последнего опроса."""
+
+        return self._pending
+
+    async def schedule(self, user_id: int, timeout: float) -> None:
+        """Запустить или перезапустить таймер пользователя."""
+
+        await get_redis_connection().zadd(
+            DEADLINES_KEY, {str(user_id): time.time() + timeout}
+        )
+
+    async def cancel(self, user_id: int) -> None:
+        """Отменить таймер пользователя."""
+
+        await get_redis_connection().zrem(DEADLINES_KEY, str(user_id))
+
+    def start(self) -> None:
+        """Запустить фоновый опрос сроков."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить опрос и освободить аренду."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.is_leader:
+            await get_redis_connection().eval(
+                RELEASE_LEASE_SCRIPT, 1, POLLER_LEASE_KEY, self.token
+            )
+            self.is_leader = False
+
+    async def _acquire_lease(self) -> bool:
+        redis_client = get_redis_connection()
+
+        if self.is_leader:
+            renewed = await redis_client.eval(
+                RENEW_LEASE_SCRIPT,
+                1,
+                POLLER_LEASE_KEY,
+                self.token,
+                self.lease_ttl_ms,
+            )
+            self.is_leader = bool(renewed)
+        else:
+            self.is_leader = bool(
+                await redis_client.set(
+                    POLLER_LEASE_KEY,
+                    self.token,
+                    nx=True,
+                    px=self.lease_ttl_ms,
+                )
+            )
+
+        return self.is_leader
+
+    async def _claim_expired(self) -> list[int]:
+        expired = await get_redis_connection().eval(
+            CLAIM_EXPIRED_SCRIPT,
+            1,
+            DEADLINES_KEY,
+            time.time(),
+            self.batch_size,
+        )
+        return [int(user_id) for user_id in expired]
+
+    async def _expire(self, user_id: int) -> None:
+        try:
+            await self.on_expire(user_id)
+        except Exception as e:
+            logger.error(
+                f"Ошибка обработки таймера пользователя {user_id}: {e}"
+            )
+
+    async def _poll(self) -> None:
+        if await self._acquire_lease():
+            while True:
+                expired = await self._claim_expired()
+                for user_id in expired:
+                    task = asyncio.create_task(self._expire(user_id))
+                    self._callbacks.add(task)
+                    task.add_done_callback(self._callbacks.discard)
+                if len(expired) < self.batch_size:
+                    break
+
+        self._pending = await get_redis_connection().zcard(DEADLINES_KEY)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.error(f"Ошибка опроса таймеров бездействия: {e}")
+            await asyncio.sleep(self.poll_interval)
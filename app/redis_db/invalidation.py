@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from redis_db.connect import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+InvalidationHandler = Callable[[str | None], Awaitable[None]]
+
+
+class InvalidationListener:
+    """
+    Подписка процесса на каналы pub/sub Redis.
+
+    Один слушатель на процесс получает сообщения об изменениях
+    и передаёт их обработчикам кешей. После (пере)подключения каждый
+    обработчик вызывается с None, чтобы кеш перечитал данные,
+    изменённые за время разрыва соединения.
+    """
+
+    def __init__(self, reconnect_delay: float = 1) -> None:
+        self.reconnect_delay = reconnect_delay
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        """Подписать обработчик на канал. Вызывается до start()."""
+
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def start(self) -> None:
+        """Запустить фоновое прослушивание каналов."""
+
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить прослушивание каналов."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _dispatch(self, channel: str, data: str | None) -> None:
+        for handler in self._handlers.get(channel, []):
+            try:
+                await handler(data)
+            except Exception as e:
+                logger.error(
+                    f"Ошибка обработки сообщения из канала {channel}: {e}"
+                )
+
+    async def _listen(self) -> None:
+        async with get_redis_connection().pubsub(
+            ignore_subscribe_messages=True
+        ) as pubsub:
+            await pubsub.subscribe(*self._handlers)
+
+            for channel in self._handlers:
+                await self._dispatch(channel, None)
+
+            while True:
+                message = await pubsub.get_message(timeout=1)
+                if message is not None:
+                    await self._dispatch(message["channel"], message["data"])
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Потеряно соединение с Redis pub/sub: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+
+
+invalidation_listener = InvalidationListener()
+
+
+async def publish_invalidation(channel: str, data: str = "") -> None:
+    """Сообщить всем репликам бота об изменении данных."""
+
+    try:
+        await get_redis_connection().publish(channel, data)
+    except Exception as e:
+        logger.error(f"Не удалось отправить сообщение в канал {channel}: {e}")
@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.methods import SendMessage
+from aiogram.types import Chat, ChatMemberUpdated, User as TelegramUser
+from aiogram.types import ChatMemberBanned, ChatMemberMember
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine
+)
+
+from app.bot import broadcast
+from app.bot.broadcast import (
+    ABORTED,
+    BROADCAST_KEY,
+    BROADCAST_LOCK,
+    FINISHED,
+    RUNNING,
+    Broadcaster,
+)
+from app.bot.handlers import user_blocked_bot, user_unblocked_bot
+
+# Модели и CRUD импортируются так же, как в коде бота, иначе таблицы
+# второй раз регистрируются в метаданных под пакетом app.
+from core.db import Base
+from crud import user_crud
+from models.models import User
+
+TG_IDS = [101, 102, 103, 104, 105]
+
+
+@pytest_asyncio.fixture
+async def session_pool(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_pool = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_pool() as session:
+        await session.execute(
+            insert(User), [{"tg_id": tg_id} for tg_id in TG_IDS]
+        )
+        await session.commit()
+    monkeypatch.setattr(broadcast, "AsyncSessionLocal", session_pool)
+    yield session_pool
+    await engine.dispose()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(broadcast, "get_redis_connection", lambda: redis)
+    return redis
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = []
+
+    async def send_message(chat_id, text):
+        sent.append(chat_id)
+
+    monkeypatch.setattr(broadcast.bot, "send_message", send_message)
+    return sent
+
+
+def make_broadcaster(**kwargs) -> Broadcaster:
+    return Broadcaster(rate=1000, chunk_size=2, retry_delay=0, **kwargs)
+
+
+async def get_blocked(session_pool) -> list[int]:
+    async with session_pool() as session:
+        return list(
+            await session.scalars(
+                select(User.tg_id).where(User.blocked_bot.is_(True))
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_all_users(session_pool, redis, sent):
+    broadcaster = make_broadcaster()
+
+    assert await broadcaster.start_broadcast("Новость", admin_id=1)
+    await broadcaster._task
+
+    assert sent[:-1] == TG_IDS
+    # Итог рассылки приходит администратору.
+    assert sent[-1] == 1
+    progress = await redis.hgetall(BROADCAST_KEY)
+    assert progress["status"] == FINISHED
+    assert progress["sent"] == str(len(TG_IDS))
+    assert not await redis.exists(BROADCAST_LOCK)
+
+
+@pytest.mark.asyncio
+async def test_failed_broadcast_is_aborted_and_resumed_from_checkpoint(
+    session_pool, redis, sent, monkeypatch
+):
+    get_recipients = user_crud.get_broadcast_recipients
+    calls = []
+
+    async def failing_get_recipients(after_id, limit, session):
+        calls.append(after_id)
+        if len(calls) > 1:
+            raise ConnectionError("БД недоступна")
+        return await get_recipients(after_id, limit, session)
+
+    monkeypatch.setattr(
+        user_crud, "get_broadcast_recipients", failing_get_recipients
+    )
+    broadcaster = make_broadcaster(max_retries=2)
+    await broadcaster.start_broadcast("Новость", admin_id=1)
+    await broadcaster._task
+
+    progress = await redis.hgetall(BROADCAST_KEY)
+    assert progress["status"] == ABORTED
+    assert progress["last_id"] == "2"
+    assert sent == [101, 102, 1]
+
+    monkeypatch.setattr(user_crud, "get_broadcast_recipients", get_recipients)
+    await redis.hset(BROADCAST_KEY, "status", RUNNING)
+    sent.clear()
+    broadcaster.start()
+    await broadcaster._task
+
+    assert sent[:-1] == [103, 104, 105]
+
+
+@pytest.mark.asyncio
+async def test_blocked_users_are_flagged_and_skipped(
+    session_pool, redis, sent, monkeypatch
+):
+    async def send_message(chat_id, text):
+        if chat_id == 103:
+            raise TelegramForbiddenError(
+                SendMessage(chat_id=chat_id, text=text), "bot was blocked"
+            )
+        sent.append(chat_id)
+
+    monkeypatch.setattr(broadcast.bot, "send_message", send_message)
+    broadcaster = make_broadcaster()
+    await broadcaster.start_broadcast("Новость", admin_id=1)
+    await broadcaster._task
+
+    assert await get_blocked(session_pool) == [103]
+    assert (await redis.hgetall(BROADCAST_KEY))["blocked"] == "1"
+
+    calls = []
+
+    async def record(chat_id, text):
+        calls.append(chat_id)
+
+    monkeypatch.setattr(broadcast.bot, "send_message", record)
+    await broadcaster.start_broadcast("Ещё новость", admin_id=1)
+    await broadcaster._task
+
+    assert 103 not in calls
+
+
+@pytest.mark.asyncio
+async def test_broadcast_is_not_started_while_locked(
+    session_pool, redis, sent
+):
+    await redis.set(BROADCAST_LOCK, "other-replica")
+    await redis.hset(
+        BROADCAST_KEY, mapping={"text": "Чужая", "status": RUNNING}
+    )
+    broadcaster = make_broadcaster()
+
+    assert not await broadcaster.start_broadcast("Новость", admin_id=1)
+    assert await redis.hget(BROADCAST_KEY, "text") == "Чужая"
+
+    # Чужая блокировка не снимается.
+    broadcaster.start()
+    await broadcaster._task
+    assert await redis.get(BROADCAST_LOCK) == "other-replica"
+    assert sent == []
+
+
+@pytest.mark.asyncio
+async def test_lock_is_kept_during_long_broadcast(
+    session_pool, redis, monkeypatch
+):
+    broadcaster = make_broadcaster(workers=1, lock_ttl=0.15)
+    owners = []
+
+    async def slow_send(chat_id, text):
+        await asyncio.sleep(0.1)
+        owners.append(await redis.get(BROADCAST_LOCK))
+
+    monkeypatch.setattr(broadcast.bot, "send_message", slow_send)
+    await broadcaster.start_broadcast("Новость", admin_id=1)
+    await broadcaster._task
+
+    assert owners == [broadcaster.consumer] * (len(TG_IDS) + 1)
+    assert await redis.hget(BROADCAST_KEY, "status") == FINISHED
+
+
+def make_member_update(old, new) -> ChatMemberUpdated:
+    user = TelegramUser(id=102, is_bot=False, first_name="Test")
+    bot_user = TelegramUser(id=1, is_bot=True, first_name="Bot")
+    return ChatMemberUpdated(
+        chat=Chat(id=102, type="private"),
+        from_user=user,
+        date=0,
+        old_chat_member=old(user=bot_user),
+        new_chat_member=new(user=bot_user),
+    )
+
+
+@pytest.mark.asyncio
+async def test_my_chat_member_updates_blocked_flag(session_pool):
+    async with session_pool() as session:
+        await user_blocked_bot(
+            make_member_update(
+                ChatMemberMember,
+                lambda user: ChatMemberBanned(user=user, until_date=0),
+            ),
+            session,
+        )
+    assert await get_blocked(session_pool) == [102]
+
+    async with session_pool() as session:
+        await user_unblocked_bot(
+            make_member_update(
+                lambda user: ChatMemberBanned(user=user, until_date=0),
+                ChatMemberMember,
+            ),
+            session,
+        )
+    assert await get_blocked(session_pool) == []
@@ -0,0 +1,85 @@
+import pytest
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.types import CallbackQuery, Update, User
+
+from app.middlewares.middleware import CallbackRoutingIndex
+
+
+def make_update(callback_data: str) -> Update:
+    return Update(
+        update_id=1,
+        callback_query=CallbackQuery(
+            id="1",
+            from_user=User(id=1, is_bot=False, first_name="Test"),
+            chat_instance="1",
+            data=callback_data,
+        ),
+    )
+
+
+def make_dispatcher(calls: list) -> Dispatcher:
+    admin_router = Router()
+    user_router = Router()
+
+    def admin_filter(callback: CallbackQuery) -> bool:
+        calls.append("admin_filter")
+        return False
+
+    admin_router.callback_query.filter(admin_filter)
+
+    @admin_router.callback_query()
+    async def admin_handler(callback: CallbackQuery):
+        calls.append("admin")
+
+    @user_router.callback_query(F.data.startswith("category:"))
+    async def category_handler(callback: CallbackQuery):
+        calls.append("category")
+
+    @user_router.callback_query(F.data == "company_info")
+    async def company_info_handler(callback: CallbackQuery):
+        calls.append("company_info")
+
+    index = CallbackRoutingIndex()
+    index.register(user_router, prefixes=("category:",))
+
+    dispatcher = Dispatcher()
+    dispatcher.include_router(admin_router)
+    dispatcher.include_router(user_router)
+    dispatcher.callback_query.outer_middleware(index)
+    return dispatcher
+
+
+@pytest.mark.asyncio
+async def test_indexed_callback_skips_other_routers():
+    calls = []
+    dispatcher = make_dispatcher(calls)
+
+    await dispatcher.feed_update(Bot("1:test"), make_update("category:5"))
+
+    assert calls == ["category"]
+
+
+@pytest.mark.asyncio
+async def test_unindexed_callback_uses_router_chain():
+    calls = []
+    dispatcher = make_dispatcher(calls)
+
+    await dispatcher.feed_update(Bot("1:test"), make_update("company_info"))
+
+    assert calls == ["admin_filter", "company_info"]
+
+
+def test_prefix_is_resolved_by_text_before_separator():
+    router = Router()
+    index = CallbackRoutingIndex()
+    index.register(router, exact=("back_to_main_menu",), prefixes=("back:",))
+
+    assert index.resolve("back:42") is router
+    assert index.resolve("back_to_main_menu") is router
+    assert index.resolve("back_to_previous_menu") is None
+    assert index.resolve("background:1") is None
+
+
+def test_prefix_without_separator_is_rejected():
+    with pytest.raises(ValueError):
+        CallbackRoutingIndex().register(Router(), prefixes=("category_",))
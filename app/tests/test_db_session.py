@@ -0,0 +1,98 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine
+)
+
+from app.middlewares.middleware import DataBaseSession
+
+# Модели импортируются так же, как в коде бота, иначе таблицы второй
+# раз регистрируются в метаданных под пакетом app.
+from core.db import Base, run_after_commit
+from models.models import User
+
+
+@pytest_asyncio.fixture
+async def session_pool():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    await engine.dispose()
+
+
+async def get_tg_ids(session_pool) -> list[int]:
+    async with session_pool() as session:
+        return list(await session.scalars(select(User.tg_id)))
+
+
+@pytest.mark.asyncio
+async def test_changes_are_committed_after_handler(session_pool):
+    committed = []
+
+    async def handler(event, data):
+        session = data["session"]
+        assert isinstance(session, AsyncSession)
+        await session.execute(insert(User).values(tg_id=1))
+
+        async def after_commit():
+            committed.append(await get_tg_ids(session_pool))
+
+        await run_after_commit(session, after_commit)
+
+    await DataBaseSession(session_pool)(handler, None, {})
+
+    assert await get_tg_ids(session_pool) == [1]
+    # Отложенное действие видит уже зафиксированные данные.
+    assert committed == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_changes_are_rolled_back_on_error(session_pool):
+    committed = []
+
+    async def handler(event, data):
+        session = data["session"]
+        await session.execute(insert(User).values(tg_id=1))
+
+        async def after_commit():
+            committed.append(True)
+
+        await run_after_commit(session, after_commit)
+        raise ValueError("Ошибка обработчика")
+
+    with pytest.raises(ValueError):
+        await DataBaseSession(session_pool)(handler, None, {})
+
+    assert await get_tg_ids(session_pool) == []
+    assert committed == []
+
+
+@pytest.mark.asyncio
+async def test_swallowed_flush_error_skips_confirmation(session_pool):
+    async with session_pool() as session:
+        await session.execute(insert(User).values(tg_id=1))
+        await session.commit()
+    answers = []
+
+    async def handler(event, data):
+        session = data["session"]
+        await session.execute(insert(User).values(tg_id=2))
+
+        async def answer():
+            answers.append("Данные добавлены!")
+
+        await run_after_commit(session, answer)
+        try:
+            session.add(User(tg_id=1))
+            await session.flush()
+        except Exception:
+            answers.append("Произошла ошибка")
+
+    await DataBaseSession(session_pool)(handler, None, {})
+
+    assert await get_tg_ids(session_pool) == [1]
+    assert answers == ["Произошла ошибка"]
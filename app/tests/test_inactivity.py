@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.bot.inactivity import InactivityScheduler
+
+
+@pytest.mark.asyncio
+async def test_timer_fires_once_after_timeout():
+    fired = []
+
+    async def on_expire(user_id):
+        fired.append(user_id)
+
+    scheduler = InactivityScheduler(on_expire)
+    scheduler.start()
+
+    await scheduler.schedule(1, 0.05)
+    assert scheduler.pending == 1
+
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert fired == [1]
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_reschedule_postpones_timer():
+    fired = []
+
+    async def on_expire(user_id):
+        fired.append(user_id)
+
+    scheduler = InactivityScheduler(on_expire)
+    scheduler.start()
+
+    await scheduler.schedule(1, 0.05)
+    await asyncio.sleep(0.03)
+    await scheduler.schedule(1, 0.1)
+    await asyncio.sleep(0.05)
+    assert fired == []
+
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert fired == [1]
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_earlier_deadline():
+    fired = []
+
+    async def on_expire(user_id):
+        fired.append(user_id)
+
+    scheduler = InactivityScheduler(on_expire)
+    scheduler.start()
+
+    await scheduler.schedule(1, 10)
+    await scheduler.schedule(2, 0.05)
+    await scheduler.schedule(3, 0.05)
+    await scheduler.cancel(3)
+    assert scheduler.pending == 2
+
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert fired == [2]
+    assert scheduler.pending == 1
@@ -0,0 +1,45 @@
+import json
+import logging
+import queue
+import sys
+
+from app.loggers.log import JsonFormatter, LogQueueHandler
+
+
+def make_record(stack_info: str | None = None) -> logging.LogRecord:
+    try:
+        raise ValueError("Ошибка")
+    except ValueError:
+        record = logging.makeLogRecord(
+            {
+                "name": "test",
+                "levelno": logging.ERROR,
+                "levelname": "ERROR",
+                "msg": "Сбой %s",
+                "args": ("1",),
+                "exc_info": sys.exc_info(),
+                "stack_info": stack_info,
+            }
+        )
+    return record
+
+
+def test_json_formatter_writes_exception_and_stack():
+    record = make_record(stack_info="Stack (most recent call last):")
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data["message"] == "Сбой 1"
+    assert data["exc_info"].endswith("ValueError: Ошибка")
+    assert data["stack_info"] == "Stack (most recent call last):"
+
+
+def test_queued_record_keeps_exception_apart_from_message():
+    log_queue = queue.Queue()
+    LogQueueHandler(log_queue).handle(make_record())
+
+    data = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+
+    assert data["message"] == "Сбой 1"
+    assert data["exc_info"].endswith("ValueError: Ошибка")
+    assert "stack_info" not in data
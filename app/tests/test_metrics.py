@@ -0,0 +1,24 @@
+import pytest
+from aiohttp import test_utils
+
+from app.core.metrics import Counter, Metric
+from app.core.metrics_server import create_metrics_app
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_renders_registry():
+    counter = Counter("test_requests_total", "Тестовый счётчик.")
+    counter.inc(3)
+
+    async with test_utils.TestClient(test_utils.TestServer(create_metrics_app())) as client:
+        response = await client.get("/metrics")
+        text = await response.text()
+
+    assert response.status == 200
+    assert "# TYPE test_requests_total counter" in text
+    assert "test_requests_total 3" in text
+
+
+def test_base_metric_cannot_be_created():
+    with pytest.raises(TypeError):
+        Metric("test_base_metric", "Метрика без значений.")
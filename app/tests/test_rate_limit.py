@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import AnswerCallbackQuery, GetUpdates, SendMessage
+
+from app.middlewares.middleware import OutgoingRateLimiter, TokenBucket
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_pause_delays_next_request():
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    bucket.pause(1)
+
+    assert bucket.reserve() == pytest.approx(1.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_requests_to_one_chat_are_spaced():
+    limiter = OutgoingRateLimiter(rate=1000, chat_rate=20, chat_burst=1)
+    sent = []
+
+    async def make_request(bot, method):
+        sent.append((method.chat_id, time.monotonic()))
+
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter(make_request, None, SendMessage(chat_id=1, text="a"))
+    await limiter(make_request, None, SendMessage(chat_id=2, text="b"))
+
+    assert sent[2][1] - start >= 0.09
+    # Другой чат не ждёт, пока освободится первый.
+    assert sent[3][1] - sent[2][1] < 0.04
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_retried_transparently():
+    limiter = OutgoingRateLimiter(max_retries=2)
+    method = SendMessage(chat_id=1, text="a")
+    calls = []
+
+    async def make_request(bot, method):
+        calls.append(method)
+        if len(calls) == 1:
+            raise TelegramRetryAfter(method, "Flood control", retry_after=0)
+        return "ok"
+
+    assert await limiter(make_request, None, method) == "ok"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_raised_when_retries_exhausted():
+    limiter = OutgoingRateLimiter(max_retries=1)
+    method = SendMessage(chat_id=1, text="a")
+
+    async def make_request(bot, method):
+        raise TelegramRetryAfter(method, "Flood control", retry_after=0)
+
+    with pytest.raises(TelegramRetryAfter):
+        await limiter(make_request, None, method)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_in_one_chat_does_not_block_others():
+    limiter = OutgoingRateLimiter(rate=1000, max_retries=1)
+    flooded = []
+
+    async def make_request(bot, method):
+        if method.chat_id == 1 and not flooded:
+            flooded.append(method)
+            raise TelegramRetryAfter(method, "Flood control", retry_after=1)
+        return "ok"
+
+    flooded_request = asyncio.create_task(
+        limiter(make_request, None, SendMessage(chat_id=1, text="a"))
+    )
+    await asyncio.sleep(0.01)
+
+    start = time.monotonic()
+    await limiter(make_request, None, SendMessage(chat_id=2, text="b"))
+    assert time.monotonic() - start < 0.1
+    assert not flooded_request.done()
+
+    flooded_request.cancel()
+
+
+@pytest.mark.asyncio
+async def test_get_updates_is_not_rate_limited():
+    limiter = OutgoingRateLimiter(rate=1)
+
+    async def make_request(bot, method):
+        return "ok"
+
+    await limiter(make_request, None, SendMessage(chat_id=1, text="a"))
+    tokens = limiter.global_bucket.tokens
+
+    start = time.monotonic()
+    await limiter(make_request, None, GetUpdates())
+    await limiter(
+        make_request, None, AnswerCallbackQuery(callback_query_id="1")
+    )
+    assert time.monotonic() - start < 0.1
+    assert limiter.global_bucket.tokens == pytest.approx(tokens, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_paused_chat_retry_does_not_take_global_token():
+    limiter = OutgoingRateLimiter(max_retries=1)
+    limiter.global_bucket = TokenBucket(rate=2, capacity=2)
+    flooded = []
+
+    async def make_request(bot, method):
+        if method.chat_id == 1 and not flooded:
+            flooded.append(method)
+            raise TelegramRetryAfter(method, "Flood control", retry_after=1)
+        return "ok"
+
+    flooded_request = asyncio.create_task(
+        limiter(make_request, None, SendMessage(chat_id=1, text="a"))
+    )
+    await asyncio.sleep(0.01)
+
+    # Повтор ждёт свой чат и не занимает токен общего ведра,
+    # поэтому сообщение в другой чат уходит сразу.
+    start = time.monotonic()
+    await limiter(make_request, None, SendMessage(chat_id=2, text="b"))
+    assert time.monotonic() - start < 0.1
+    assert not flooded_request.done()
+
+    flooded_request.cancel()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_without_chat_does_not_delay_chats():
+    limiter = OutgoingRateLimiter(max_retries=1)
+    flooded = []
+
+    async def make_request(bot, method):
+        if isinstance(method, AnswerCallbackQuery) and not flooded:
+            flooded.append(method)
+            raise TelegramRetryAfter(method, "Flood control", retry_after=1)
+        return "ok"
+
+    flooded_request = asyncio.create_task(
+        limiter(
+            make_request, None, AnswerCallbackQuery(callback_query_id="1")
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    start = time.monotonic()
+    await limiter(make_request, None, SendMessage(chat_id=1, text="a"))
+    assert time.monotonic() - start < 0.1
+    assert not flooded_request.done()
+
+    flooded_request.cancel()
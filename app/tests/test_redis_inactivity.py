@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.redis_db import inactivity
+from app.redis_db.inactivity import (
+    DEADLINES_KEY,
+    POLLER_LEASE_KEY,
+    RedisInactivityScheduler,
+)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(inactivity, "get_redis_connection", lambda: redis)
+    return redis
+
+
+def make_scheduler(fired: list) -> RedisInactivityScheduler:
+    async def on_expire(user_id):
+        fired.append(user_id)
+
+    return RedisInactivityScheduler(on_expire, poll_interval=0.02)
+
+
+@pytest.mark.asyncio
+async def test_timer_fires_once_after_timeout(redis):
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.start()
+
+    await scheduler.schedule(1, 0.05)
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert fired == [1]
+    assert await redis.zcard(DEADLINES_KEY) == 0
+
+
+@pytest.mark.asyncio
+async def test_reschedule_postpones_timer(redis):
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.start()
+
+    await scheduler.schedule(1, 0.05)
+    await asyncio.sleep(0.03)
+    await scheduler.schedule(1, 0.1)
+    await asyncio.sleep(0.05)
+    assert fired == []
+
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert fired == [1]
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_earlier_deadline(redis):
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.start()
+
+    await scheduler.schedule(1, 10)
+    await scheduler.schedule(2, 0.05)
+    await scheduler.schedule(3, 0.05)
+    await scheduler.cancel(3)
+
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert fired == [2]
+    assert scheduler.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_only_lease_holder_fires_timers(redis):
+    fired = []
+    schedulers = [make_scheduler(fired), make_scheduler(fired)]
+    for scheduler in schedulers:
+        scheduler.start()
+
+    await schedulers[0].schedule(1, 0.05)
+    await asyncio.sleep(0.15)
+
+    assert fired == [1]
+    assert [scheduler.is_leader for scheduler in schedulers].count(True) == 1
+    for scheduler in schedulers:
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_lease_is_renewed_and_released_by_owner_only(redis):
+    owner = make_scheduler([])
+    other = make_scheduler([])
+
+    assert await owner._acquire_lease()
+    assert not await other._acquire_lease()
+
+    # Продление обновляет срок аренды только у владельца.
+    await redis.pexpire(POLLER_LEASE_KEY, 100)
+    assert await owner._acquire_lease()
+    assert await redis.pttl(POLLER_LEASE_KEY) > 100
+
+    await other.stop()
+    assert await redis.get(POLLER_LEASE_KEY) == owner.token
+
+    await owner.stop()
+    assert not await redis.exists(POLLER_LEASE_KEY)
+    assert not owner.is_leader
+
+
+@pytest.mark.asyncio
+async def test_lease_is_lost_after_another_process_takes_it(redis):
+    scheduler = make_scheduler([])
+    assert await scheduler._acquire_lease()
+
+    await redis.set(POLLER_LEASE_KEY, "other-process")
+
+    assert not await scheduler._acquire_lease()
+    await scheduler.stop()
+    assert await redis.get(POLLER_LEASE_KEY) == "other-process"
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_each_expired_deadline_once(redis):
+    now = time.time()
+    await redis.zadd(
+        DEADLINES_KEY, {"1": now - 2, "2": now - 1, "3": now + 60}
+    )
+    scheduler = make_scheduler([])
+    scheduler.batch_size = 1
+
+    assert await scheduler._claim_expired() == [1]
+    assert await scheduler._claim_expired() == [2]
+    assert await scheduler._claim_expired() == []
+    assert await redis.zrange(DEADLINES_KEY, 0, -1) == ["3"]
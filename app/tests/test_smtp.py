@@ -0,0 +1,94 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from aiosmtplib import SMTPException
+from fakeredis import FakeAsyncRedis
+
+from app.bot import smtp
+from app.bot.smtp import (
+    MAIL_DEAD_LETTER_STREAM,
+    MAIL_GROUP,
+    MAIL_STREAM,
+    MailOutboxWorker,
+)
+
+USER_DATA = {"first_name": "Иван", "phone_number": "+71234567890"}
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(smtp, "get_redis_connection", lambda: redis)
+    return redis
+
+
+async def make_worker(redis, **kwargs) -> MailOutboxWorker:
+    worker = MailOutboxWorker(block_ms=None, retry_delay=0, **kwargs)
+    worker.smtp.send = AsyncMock()
+    worker.smtp.close = AsyncMock()
+    await worker._ensure_group(redis)
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_sent_mail_is_removed_from_stream(redis):
+    worker = await make_worker(redis)
+    await smtp.enqueue_mail("Заявка", "a@b.c", USER_DATA, "manager")
+
+    await worker._collect(redis)
+    await worker._flush_due(redis)
+
+    worker.smtp.send.assert_awaited_once()
+    assert await redis.xlen(MAIL_STREAM) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_send_keeps_entry_in_stream(redis):
+    worker = await make_worker(redis, max_retries=3)
+    worker.smtp.send.side_effect = SMTPException("Сервер недоступен")
+    await smtp.enqueue_mail("Заявка", "a@b.c", USER_DATA, "manager")
+
+    await worker._collect(redis)
+    await worker._flush_due(redis)
+
+    assert await redis.xlen(MAIL_STREAM) == 1
+    pending = await redis.xpending(MAIL_STREAM, MAIL_GROUP)
+    assert pending["pending"] == 1
+    assert await redis.xlen(MAIL_DEAD_LETTER_STREAM) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_block_other_batches(redis):
+    worker = await make_worker(redis, retry_max_delay=60)
+    worker.retry_delay = 60
+
+    async def send(message):
+        if message["To"] == "down@b.c":
+            raise SMTPException("Сервер недоступен")
+
+    worker.smtp.send.side_effect = send
+    await smtp.enqueue_mail("Заявка", "down@b.c", USER_DATA, "manager")
+    await smtp.enqueue_mail("Заявка", "up@b.c", USER_DATA, "manager")
+
+    await worker._collect(redis)
+    await worker._flush_due(redis)
+
+    # Письмо на рабочий адрес ушло, неудачное ждёт следующей попытки.
+    assert await redis.xlen(MAIL_STREAM) == 1
+    await worker._flush_due(redis)
+    assert worker.smtp.send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_mail_moves_to_dead_letter_after_retries(redis):
+    worker = await make_worker(redis, max_retries=2)
+    worker.smtp.send.side_effect = SMTPException("Сервер недоступен")
+    await smtp.enqueue_mail("Заявка", "a@b.c", USER_DATA, "manager")
+
+    await worker._collect(redis)
+    await worker._flush_due(redis)
+    await worker._flush_due(redis)
+
+    assert await redis.xlen(MAIL_STREAM) == 0
+    dead = await redis.xrange(MAIL_DEAD_LETTER_STREAM)
+    assert dead[0][1]["phone_number"] == USER_DATA["phone_number"]
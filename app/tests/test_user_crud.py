@@ -0,0 +1,64 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine
+)
+
+from app.middlewares.middleware import DataBaseSession
+
+# Модели импортируются так же, как в коде бота, иначе таблицы второй
+# раз регистрируются в метаданных под пакетом app.
+from core.db import Base
+from crud import user_crud
+from crud.ttl_cache import TTLCache
+from models.models import User
+
+
+@pytest_asyncio.fixture
+async def session_pool(monkeypatch):
+    redis = FakeAsyncRedis()
+    monkeypatch.setattr(
+        "redis_db.invalidation.get_redis_connection", lambda: redis
+    )
+    monkeypatch.setattr(user_crud, "known_users", TTLCache(60, max_size=2))
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    await engine.dispose()
+
+
+async def run(session_pool, callback) -> None:
+    async def handler(event, data):
+        await callback(data["session"])
+
+    await DataBaseSession(session_pool)(handler, None, {})
+
+
+@pytest.mark.asyncio
+async def test_known_users_cache_is_bounded(session_pool):
+    for tg_id in (1, 2, 3):
+        await run(session_pool, lambda s, i=tg_id: user_crud.ensure_user(i, s))
+
+    assert 1 not in user_crud.known_users
+    assert 3 in user_crud.known_users
+
+
+@pytest.mark.asyncio
+async def test_removed_user_is_registered_again(session_pool):
+    await run(session_pool, lambda s: user_crud.ensure_user(1, s))
+
+    async def remove(session):
+        user = await user_crud.get_user_by_tg_id(1, session)
+        await user_crud.remove(user, session)
+
+    await run(session_pool, remove)
+    assert 1 not in user_crud.known_users
+
+    await run(session_pool, lambda s: user_crud.ensure_user(1, s))
+    async with session_pool() as session:
+        assert list(await session.scalars(select(User.tg_id))) == [1]